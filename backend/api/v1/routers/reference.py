@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Body, HTTPException, UploadFile, File, Depends
+from fastapi import APIRouter, Body, HTTPException, UploadFile, File, Depends, Request, Response
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session
 from typing import List, Dict
 import pandas as pd
+import hashlib
+import json
 import logging
 from datetime import datetime
 from backend.db.database import DatabaseConnection
@@ -61,11 +64,18 @@ async def upload_reference_data(file: UploadFile = File(...)):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/list")
-async def list_reference_data():
-    """Get list of all reference data"""
+async def list_reference_data(request: Request, response: Response):
+    """Get list of all reference data, honouring If-None-Match"""
     try:
         db = DatabaseConnection()
-        results = await db.get_reference_data_list()
+        results = jsonable_encoder(await db.get_reference_data_list())
+        payload = json.dumps(results, sort_keys=True).encode()
+        etag = f'"{hashlib.sha1(payload).hexdigest()}"'
+        
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        
+        response.headers["ETag"] = etag
         return results
     except Exception as e:
         logger.error(f"Error listing reference data: {str(e)}")
@@ -120,6 +130,35 @@ async def delete_reference_data(reference_id: str):
         raise HTTPException(status_code=500, detail=str(e))
     
 
+@router.post("/batch-delete")
+async def batch_delete_reference_data(data: Dict = Body(...)):
+    """Delete several reference data entries in a single request"""
+    reference_ids = data.get('ids') or []
+    if not reference_ids:
+        raise HTTPException(status_code=400, detail="No reference ids provided")
+    
+    try:
+        # Delete measurements first due to foreign key constraint
+        await db.execute_query("""
+            DELETE FROM reference_measurements 
+            WHERE reference_id = ANY(:reference_ids)
+            RETURNING reference_id
+        """, {'reference_ids': reference_ids})
+        
+        result = await db.execute_query("""
+            DELETE FROM reference_data 
+            WHERE reference_id = ANY(:reference_ids)
+            RETURNING reference_id
+        """, {'reference_ids': reference_ids})
+        
+        return {
+            "status": "success",
+            "deleted": [row['reference_id'] for row in result]
+        }
+    except Exception as e:
+        logger.error(f"Error batch deleting reference data: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.post("/save")
 async def save_reference_data(data: Dict = Body(...)):
     """Save reference data and measurements"""
@@ -2,6 +2,7 @@
 from typing import List, Dict, Any, Optional, Union
 import httpx
 import asyncio
+import threading
 from datetime import datetime
 import logging
 from pathlib import Path
@@ -28,6 +29,13 @@ class APIClient:
         self.client_lock = asyncio.Lock()
         self._closed = False
         
+        # Dedicated event loop so one client can be shared across worker threads
+        self.loop = None
+        self._loop_thread = None
+        self._loop_lock = threading.Lock()
+        self._shutting_down = False
+        self._cleanup_done = threading.Event()
+        
         # Log configuration (but not in production)
         if not is_production():
             logger.info(f"APIClient initialized with:")
@@ -35,6 +43,72 @@ class APIClient:
             logger.info(f"  Timeout: {self.timeout}s")
             logger.info(f"  SSL Verify: {self.verify_ssl}")
 
+    def _ensure_loop(self):
+        """Start the client's own event loop thread on first use"""
+        with self._loop_lock:
+            if self._shutting_down:
+                raise RuntimeError("APIClient is shutting down")
+            if self.loop is None:
+                self.loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._run_loop,
+                    name="APIClientLoop",
+                    daemon=True
+                )
+                self._loop_thread.start()
+            return self.loop
+
+    def _run_loop(self):
+        """Body of the loop thread; closes the loop once it is stopped"""
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+        finally:
+            try:
+                self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            finally:
+                self.loop.close()
+                self._cleanup_done.set()
+
+    def start_loop(self):
+        """Send this client's HTTP traffic on its own loop thread, so worker threads can share it"""
+        self._ensure_loop()
+
+    async def run_on_loop(self, coro):
+        """Await a coroutine on this client's own event loop from any other loop"""
+        try:
+            loop = self._ensure_loop()
+        except RuntimeError:
+            coro.close()
+            raise
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        return await asyncio.wrap_future(future)
+
+    async def _on_client_loop(self, coro):
+        """Await coro on the client's own loop once started, else on the caller's loop"""
+        loop = self.loop
+        if loop is None or asyncio.get_running_loop() is loop:
+            return await coro
+        return await self.run_on_loop(coro)
+
+    def shutdown(self, timeout=5.0):
+        """Close the client on its own loop, then stop the loop thread"""
+        with self._loop_lock:
+            self._shutting_down = True
+            loop = self.loop
+        
+        if loop is None:
+            return
+        
+        future = asyncio.run_coroutine_threadsafe(self.close(), loop)
+        try:
+            future.result(timeout=timeout)
+        except Exception as e:
+            logger.error(f"Error closing client: {str(e)}")
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            self._cleanup_done.wait(timeout)
+
     async def _get_client(self):
         """Get or create HTTP client with safety checks"""
         if self._closed:
@@ -51,11 +125,16 @@ class APIClient:
                 )
             return self.client
 
+    async def _send(self, method: str, url: str, **kwargs):
+        """Send a request on the shared httpx client and return the raw response"""
+        client = await self._get_client()
+        return await client.request(method, url, **kwargs)
+
     async def _make_request(self, method: str, url: str, **kwargs):
         """Make HTTP request with proper error handling"""
-        client = await self._get_client()
         try:
-            response = await client.request(method, url, **kwargs)
+            # Only the network I/O moves to the client's loop; the caller keeps its own thread
+            response = await self._on_client_loop(self._send(method, url, **kwargs))
             response.raise_for_status()
             
             # Handle different response types
@@ -222,6 +301,27 @@ class APIClient:
             logger.error(f"Error getting reference data list: {str(e)}")
             return []
 
+    async def get_reference_data_list_if_changed(
+        self,
+        etag: Optional[str] = None
+    ) -> tuple:
+        """Get reference data list unless it still matches the given ETag.
+        
+        Returns (data, etag); data is None when the server reports no change.
+        """
+        try:
+            headers = {'If-None-Match': etag} if etag else {}
+            response = await self._on_client_loop(
+                self._send("GET", "/api/v1/reference/list", headers=headers)
+            )
+            if response.status_code == 304:
+                return None, etag
+            response.raise_for_status()
+            return response.json(), response.headers.get('etag')
+        except Exception as e:
+            logger.error(f"Error getting reference data list: {str(e)}")
+            return [], None
+
     async def get_reference_data(self, reference_id: str) -> Dict:
         """Get specific reference data entry"""
         try:
@@ -271,6 +371,18 @@ class APIClient:
             logger.error(f"Error deleting reference data: {str(e)}")
             raise
 
+    async def delete_reference_data_batch(self, reference_ids: List[str]) -> Dict:
+        """Delete several reference data entries in one request"""
+        try:
+            return await self._make_request(
+                "POST",
+                "/api/v1/reference/batch-delete",
+                json={'ids': reference_ids}
+            )
+        except Exception as e:
+            logger.error(f"Error batch deleting reference data: {str(e)}")
+            raise
+
     # =================
     # Input Data Management
     # =================
@@ -673,6 +785,11 @@ class APIClient:
     
     async def close(self):
         """Close client resources safely"""
+        if self._closed:
+            return
+        if self.loop is not None and asyncio.get_running_loop() is not self.loop:
+            # The httpx client lives on the client's own loop and must be closed there
+            return await self._on_client_loop(self.close())
         if not self._closed:
             self._closed = True
             if self.client:
@@ -685,7 +802,7 @@ class APIClient:
 
     async def __aenter__(self):
         """Async context manager entry"""
-        await self._get_client()
+        await self._on_client_loop(self._get_client())
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -78,12 +78,16 @@ class AsyncWorker(QThread):
             self._task = None
             self._is_running = False
 
-    def stop(self):
+    def cancel(self):
+        """Request cancellation of the running task without waiting for it"""
         if self._is_running and self._loop and not self._loop.is_closed():
             try:
                 self._loop.call_soon_threadsafe(self._cancel_task)
             except Exception as e:
                 logger.error("Error cancelling task: %s", str(e))
+
+    def stop(self):
+        self.cancel()
         self.wait()
     
     def _cancel_task(self):
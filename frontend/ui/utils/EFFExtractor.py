@@ -52,6 +52,7 @@ class EFFExtractor:
         """Executes batch file and returns the last line of output"""
         process = subprocess.Popen(bat_file_path, shell=True, stdout=subprocess.PIPE, text=True)
         log_path = bat_file_path.replace("bat", "txt")
+        # The wait happens in the OS with the GIL released, so batches run in parallel threads
         output, _ = process.communicate()
         output_lines = output.splitlines()
         last_line = output_lines[-1] if output_lines else "No output"
@@ -1,4 +1,4 @@
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import QObject, QRunnable, Signal
 from typing import List, Dict, Optional
 import os
 import concurrent.futures
@@ -15,13 +15,17 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
-class ExtractionWorker(QThread):
+class WorkerSignals(QObject):
     progress = Signal(str, int, str, float)
     finished = Signal(list)
-    file_created = Signal(str)
-    
+    file_created = Signal(str, str, str, object)
+
+class ExtractionWorker(QRunnable):
     def __init__(self, lot: str, insertions: List[str], extractor: EFFExtractor, wafer: Optional[str] = None, max_workers: int = None):
         super().__init__()
+        # Python keeps the worker (and its signals) alive until the results are delivered
+        self.setAutoDelete(False)
+        self.signals = WorkerSignals()
         self.lot = lot
         self.insertions = insertions
         self.extractor = extractor
@@ -72,7 +76,7 @@ class ExtractionWorker(QThread):
         progress = int((completed / total) * 100)
         
         for result in self._status_dict.values():
-            self.progress.emit(
+            self.signals.progress.emit(
                 result['filename'],
                 progress,
                 result.get('real_filename', result['filename']),
@@ -94,7 +98,7 @@ class ExtractionWorker(QThread):
                         self._status_dict[insertion] = result
                         
                         if 'file_path' in result:
-                            self.file_created.emit(result['file_path'])
+                            self.signals.file_created.emit(result['file_path'], self.lot, insertion, self.wafer)
                         
                         self._update_progress()
                         
@@ -109,7 +113,7 @@ class ExtractionWorker(QThread):
                 result['status'] 
                 for result in self._status_dict.values()
             ]
-            self.finished.emit(status_list)
+            self.signals.finished.emit(status_list)
             
         except Exception as e:
-            self.finished.emit([str(e)])
\ No newline at end of file
+            self.signals.finished.emit([str(e)])
\ No newline at end of file
@@ -198,6 +198,7 @@ class ReferenceSelectionPage(QWidget):
         self.selected_lots = {}
         self.selected_insertions = {}
         self.cloud_worker = None
+        self.loadingWidget = None
         self.initUI()
     
     def initUI(self):
@@ -352,6 +353,11 @@ class ReferenceSelectionPage(QWidget):
         mainLayout.addWidget(groupBox)
     
     def onSourceChanged(self):
+        # The loading overlay lives outside the layout, so remove it explicitly
+        if self.loadingWidget is not None:
+            self.loadingWidget.deleteLater()
+            self.loadingWidget = None
+        
         # Clear the content area
         while self.contentLayout.count():
             child = self.contentLayout.takeAt(0)
@@ -393,7 +399,7 @@ class ReferenceSelectionPage(QWidget):
         self.fileListScrollArea = QScrollArea()
         self.fileListScrollArea.setMinimumHeight(200)
         self.fileListScrollArea.setWidgetResizable(True)
-        self.fileListScrollArea.setStyleSheet("QScrollArea { border: none; }")
+        self.fileListScrollArea.setFrameShape(QFrame.NoFrame)
         
         self.fileListContent = QWidget()
         self.fileListLayout = QVBoxLayout(self.fileListContent)
@@ -431,8 +437,9 @@ class ReferenceSelectionPage(QWidget):
         searchContainerLayout.addWidget(searchIcon)
         self.contentLayout.addWidget(searchContainer)
         
-        # Loading indicator
-        self.loadingWidget = QWidget()
+        # Loading indicator, floated over the page so showing/hiding it
+        # does not invalidate the content layout
+        self.loadingWidget = QWidget(self)
         loadingLayout = QVBoxLayout(self.loadingWidget)
         loadingLabel = QLabel("Loading reference data...")
         loadingLabel.setAlignment(Qt.AlignCenter)
@@ -456,7 +463,9 @@ class ReferenceSelectionPage(QWidget):
         loadingLayout.addWidget(loadingLabel)
         loadingLayout.addWidget(self.loadingProgress)
         loadingLayout.setContentsMargins(20, 40, 20, 40)
-        self.contentLayout.addWidget(self.loadingWidget)
+        self.positionLoadingOverlay()
+        self.loadingWidget.raise_()
+        self.loadingWidget.show()
         
         # Products tree (initially hidden)
         productsLabel = QLabel("Available Products:")
@@ -507,6 +516,18 @@ class ReferenceSelectionPage(QWidget):
         # Load cloud data
         self.loadCloudData()
     
+    def positionLoadingOverlay(self):
+        """Center the loading overlay over the content area"""
+        if self.loadingWidget is None:
+            return
+        area = self.contentArea.geometry()
+        height = self.loadingWidget.sizeHint().height()
+        self.loadingWidget.setGeometry(area.x(), (self.height() - height) // 2, area.width(), height)
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.positionLoadingOverlay()
+    
     def loadCloudData(self):
         """Load available products from cloud"""
         if self.cloud_worker and self.cloud_worker.isRunning():
@@ -519,7 +540,8 @@ class ReferenceSelectionPage(QWidget):
     
     def onCloudDataLoaded(self, data):
         """Handle successful cloud data loading"""
-        self.loadingWidget.hide()
+        if self.loadingWidget is not None:
+            self.loadingWidget.hide()
         self.productsLabelWidget.show()
         self.productsTree.show()
         self.productsScrollArea.show()
@@ -528,7 +550,8 @@ class ReferenceSelectionPage(QWidget):
     
     def onCloudDataError(self, error_message):
         """Handle cloud data loading error"""
-        self.loadingWidget.hide()
+        if self.loadingWidget is not None:
+            self.loadingWidget.hide()
         
         # Show error message
         errorLabel = QLabel(f"Error loading reference data: {error_message}")
@@ -1,54 +1,302 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFrame,QLineEdit,
                                QLabel, QPushButton, QComboBox, QProgressBar, 
                                QTableWidget, QTableWidgetItem, QFileDialog,
-                               QMessageBox, QScrollArea, QApplication,
+                               QMessageBox, QScrollArea,
                                QGroupBox, QSizePolicy, QCheckBox)
-from PySide6.QtCore import Qt, QTimer, Signal, QThread
+from PySide6.QtCore import Qt, QTimer, Signal, QThread, QEventLoop
 from PySide6.QtGui import QFont, QIcon, QColor
 from ui.utils.EFFProcessor import EFFProcessor
 from ui.widgets.EFFUploadDialog import EFFUploadDialog
 from ui.utils.AsyncWorker import AsyncWorker
 from datetime import datetime
+from functools import lru_cache, cached_property
 import asyncio
 import traceback
 import numpy as np
 from scipy import stats
 import pickle
 import os
+import sys
+import time
+from collections import defaultdict
 
 import logging
-from PySide6.QtCore import QThread, Signal
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# On-disk snapshot of the reference data list, validated against the server ETag
+REFERENCE_CACHE_PATH = 'models/refdata_cache.pkl'
+
+# Upper bound on in-flight API requests issued concurrently by the tab
+MAX_CONCURRENT_REQUESTS = 10
+
+# Low-cardinality reference fields used by the filters and matching logic
+CATEGORICAL_FIELDS = ('product', 'lot', 'test_name', 'insertion')
+
+# Larger feature arrays are subsampled to this size before the KS test
+KS_MAX_SAMPLES = 10_000
+
+# Oldest status log rows are evicted beyond this many
+MAX_STATUS_ROWS = 500
+
+
+# Shared stylesheets, built once at import
+_BTN_PRIMARY_QSS = """
+    QPushButton {
+        background-color: #1849D6;
+        color: white;
+        border-radius: 5px;
+        padding: 8px 15px;
+        font-weight: bold;
+        margin-right: 10px;
+    }
+    QPushButton:hover {
+        background-color: #0f3bb3;
+    }
+    QPushButton:disabled {
+        background-color: #CCCCCC;
+    }
+"""
+
+_BTN_DANGER_QSS = """
+    QPushButton {
+        background-color: #FF0000;
+        color: white;
+        border-radius: 5px;
+        padding: 8px 15px;
+        font-weight: bold;
+        margin-right: 10px;
+    }
+    QPushButton:hover {
+        background-color: #CC0000;
+    }
+    QPushButton:disabled {
+        background-color: #CCCCCC;
+    }
+"""
+
+_VAMOS_STATUS_QSS = """
+    QLabel {
+        background-color: #28a745;
+        color: white;
+        padding: 8px 15px;
+        border-radius: 5px;
+        font-weight: bold;
+    }
+"""
+
+_PROGRESS_QSS = """
+    QProgressBar {
+        border: 2px solid #CCCCCC;
+        border-radius: 5px;
+        text-align: center;
+        height: 25px;
+        background-color: #f0f0f0;
+    }
+    QProgressBar::chunk {
+        background-color: #1849D6;
+        border-radius: 3px;
+    }
+"""
+
+_COMBO_QSS = """
+    QComboBox {
+        padding: 6px;
+        border: 1px solid #CCCCCC;
+        border-radius: 5px;
+        background-color: white;
+        min-width: 80px;
+    }
+    QComboBox:focus {
+        border-color: #1849D6;
+    }
+"""
+
+_BTN_CLEAR_QSS = """
+    QPushButton {
+        background-color: #FFA500;
+        color: white;
+        padding: 6px 12px;
+        border-radius: 5px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #e68a00;
+    }
+"""
+
+_TABLE_QSS = """
+    QTableWidget {
+        border: 1px solid #CCCCCC;
+        border-radius: 5px;
+        gridline-color: #f0f0f0;
+        background-color: white;
+        selection-background-color: #1849D6;
+    }
+    QHeaderView::section {
+        background-color: #f8f9fa;
+        color: black;
+        padding: 8px;
+        border: 1px solid #CCCCCC;
+        font-weight: bold;
+    }
+    QTableWidget::item {
+        padding: 8px;
+        border-bottom: 1px solid #f0f0f0;
+    }
+    QTableWidget::item:selected {
+        background-color: #1849D6;
+        color: white;
+    }
+"""
+
+_STATUS_TABLE_QSS = """
+    QTableWidget {
+        border: 1px solid #CCCCCC;
+        border-radius: 5px;
+        gridline-color: #f0f0f0;
+        background-color: white;
+    }
+    QHeaderView::section {
+        background-color: #f8f9fa;
+        color: black;
+        padding: 6px;
+        border: 1px solid #CCCCCC;
+        font-weight: bold;
+        font-size: 9px;
+    }
+    QTableWidget::item {
+        padding: 4px;
+        border-bottom: 1px solid #f0f0f0;
+        font-size: 9px;
+    }
+"""
+
+_FILE_FRAME_QSS = """
+    QFrame {
+        background-color: #f8f9fa;
+        border: 2px dashed #1849D6;
+        border-radius: 8px;
+        padding: 20px;
+    }
+"""
+
+_RETRAIN_CHECKBOX_QSS = """
+    QCheckBox {
+        font-weight: bold;
+        color: #1849D6;
+        padding: 10px;
+        background-color: #e3f2fd;
+        border-radius: 5px;
+    }
+    QCheckBox::indicator {
+        width: 20px;
+        height: 20px;
+    }
+"""
+
+_BTN_UPLOAD_QSS = """
+    QPushButton {
+        background-color: #1849D6;
+        color: white;
+        font-weight: bold;
+        padding: 8px 20px;
+        border-radius: 5px;
+    }
+    QPushButton:hover {
+        background-color: #0f3bb3;
+    }
+    QPushButton:disabled {
+        background-color: #CCCCCC;
+    }
+"""
+
+_LINEEDIT_QSS = """
+    QLineEdit {
+        padding: 8px;
+        border: 1px solid #CCCCCC;
+        border-radius: 5px;
+        font-size: 12px;
+    }
+    QLineEdit:focus {
+        border-color: #1849D6;
+    }
+"""
+
+
+@lru_cache(maxsize=None)
+def _font(size, bold=False):
+    """Shared Arial font, created on first use once a QApplication exists"""
+    return QFont("Arial", size, QFont.Bold if bold else QFont.Normal)
+
+
+@lru_cache(maxsize=4096)
+def _format_created_at(created_at):
+    """Format an ISO timestamp for display, falling back to the raw value"""
+    try:
+        dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+        return dt.strftime("%Y-%m-%d %H:%M")
+    except Exception:
+        return created_at
+
 
 class DistributionComparator:
     """Compares distributions between new data and reference data"""
     
+    # Loaded models shared across instances, keyed by absolute path
+    _model_cache = {}
+    
     def __init__(self, model_path='models/my_distribution_model.pkl'):
         self.model_path = model_path
-        self.model = self._load_model()
+        self._feat_cache = {}
+    
+    @cached_property
+    def model(self):
+        """Distribution model, loaded on first access"""
+        return self._load_model()
     
     def _load_model(self):
         """Load the distribution model"""
         try:
             if os.path.exists(self.model_path):
-                with open(self.model_path, 'rb') as f:
-                    return pickle.load(f)
+                path = os.path.abspath(self.model_path)
+                mtime = os.stat(path).st_mtime
+                cached = DistributionComparator._model_cache.get(path)
+                if cached and cached[0] == mtime:
+                    return cached[1]
+                with open(path, 'rb') as f:
+                    model = pickle.load(f)
+                DistributionComparator._model_cache[path] = (mtime, model)
+                return model
         except Exception as e:
             logger.error(f"Error loading model: {e}")
         return None
     
-    def calculate_confidence(self, new_data, reference_data):
+    def calculate_confidence(self, new_data, reference_data, ref_key=None):
         """Calculate confidence score between distributions"""
         try:
             # Extract numerical features from both datasets
             new_features = self._extract_features(new_data)
-            ref_features = self._extract_features(reference_data)
-            
+            ref_features = self._extract_features_cached(reference_data, ref_key)
+
+            # Too few points for a meaningful test
+            if new_features.size < 3 or ref_features.size < 3:
+                return 0.0
+
+            # Identical samples need no test
+            if new_features.size == ref_features.size and np.array_equal(new_features, ref_features):
+                return 100.0
+
+            # KS is a max of CDF differences, so a 10k-point random subsample
+            # keeps the statistic within ~0.02 of the full-sample value (DKW bound)
+            if min(new_features.size, ref_features.size) > KS_MAX_SAMPLES:
+                rng = np.random.default_rng(0)
+                new_features = rng.choice(new_features, KS_MAX_SAMPLES, replace=False)
+                ref_features = rng.choice(ref_features, KS_MAX_SAMPLES, replace=False)
+
             # Use Kolmogorov-Smirnov test for distribution comparison
-            ks_statistic, p_value = stats.ks_2samp(new_features, ref_features)
+            ks_statistic, p_value = self._ks_2samp(new_features, ref_features)
             
             # Convert to confidence percentage (higher p-value = more similar)
             confidence = min(p_value * 100, 100)
@@ -58,15 +306,41 @@ class DistributionComparator:
             logger.error(f"Error calculating confidence: {e}")
             return 0
     
+    def _ks_2samp(self, a, b):
+        """Vectorized two-sample KS statistic with asymptotic p-value"""
+        n1, n2 = a.size, b.size
+        a = np.sort(a)
+        b = np.sort(b)
+        data_all = np.concatenate([a, b])
+        cdf1 = np.searchsorted(a, data_all, side='right') / n1
+        cdf2 = np.searchsorted(b, data_all, side='right') / n2
+        d = float(np.max(np.abs(cdf1 - cdf2)))
+        en = n1 * n2 / (n1 + n2)
+        p_value = float(stats.kstwo.sf(d, np.round(en)))
+        return d, p_value
+    
+    def _extract_features_cached(self, data, key):
+        """Extract features, reusing the array from a previous call with the same key"""
+        if key is None:
+            return self._extract_features(data)
+        features = self._feat_cache.get(key)
+        if features is None:
+            features = self._extract_features(data)
+            self._feat_cache[key] = features
+        return features
+    
+    def clear_feature_cache(self):
+        """Drop cached reference features, e.g. after reference data is reloaded"""
+        self._feat_cache.clear()
+    
     def _extract_features(self, data):
         """Extract numerical features from data"""
         # This should be adapted based on your data structure
-        features = []
-        for item in data:
-            # Example: extract test values or other numerical features
-            if isinstance(item, dict) and 'value' in item:
-                features.append(float(item['value']))
-        return np.array(features)
+        return np.fromiter(
+            (float(item['value']) for item in data
+             if isinstance(item, dict) and 'value' in item),
+            dtype=np.float64
+        )
     
     def find_best_match(self, new_data_metadata, all_reference_data):
         """Find best matching reference data"""
@@ -104,15 +378,21 @@ class ModelVersionManager:
     
     def _get_current_version(self):
         """Get the current model version number"""
-        import re
         version = 1
         model_dir = os.path.dirname(self.base_path)
+        prefix = os.path.basename(self.base_path) + '_v'
         
         if os.path.exists(model_dir):
-            for filename in os.listdir(model_dir):
-                match = re.match(r'my_distribution_model_v(\d+)', filename)
-                if match:
-                    version = max(version, int(match.group(1)))
+            with os.scandir(model_dir) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    filename = entry.name
+                    if filename.startswith(prefix):
+                        try:
+                            version = max(version, int(filename[len(prefix):].split('.')[0]))
+                        except ValueError:
+                            pass
         
         return version
     
@@ -122,7 +402,7 @@ class ModelVersionManager:
         new_path = f"{self.base_path}_v{new_version}.pkl"
         
         with open(new_path, 'wb') as f:
-            pickle.dump(model_data, f)
+            pickle.dump(model_data, f, protocol=pickle.HIGHEST_PROTOCOL)
         
         self.current_version = new_version
         return new_path, new_version
@@ -134,9 +414,16 @@ class RetrainingTab(QWidget):
     def __init__(self, api_client):
         super().__init__()
         self.api_client = api_client
+        # Workers share this client from their own threads; its requests run on its loop
+        self.api_client.start_loop()
         self.workers = []
         self.current_worker = None
         self.reference_data = []
+        self._ref_index = {}
+        self._ref_by_insertion = {}
+        self._ref_columns = {}
+        self._last_pct = 0
+        self._last_emit = 0.0
         self.data_summary = []
         self.connection_status = "unknown"
         self.distribution_comparator = DistributionComparator()
@@ -147,6 +434,20 @@ class RetrainingTab(QWidget):
             'test_name': '',
             'insertion': ''
         }
+        
+        # Status messages are buffered and flushed to the table in batches
+        self._pending_status = []
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(50)
+        self._status_timer.timeout.connect(self._flush_status_messages)
+        
+        # Filter edits are debounced so typing triggers a single refilter
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(200)
+        self._filter_timer.timeout.connect(self.apply_filters)
+        
         self.initUI()
         QTimer.singleShot(0, self.load_initial_data)
 
@@ -214,28 +515,74 @@ class RetrainingTab(QWidget):
         worker.start()
 
     async def _async_load_reference_data(self):
-        from api.client import APIClient
-        
-        worker_api_client = None
         try:
-            worker_api_client = APIClient()
-            data = await worker_api_client.get_reference_data_list()
+            cached_etag, cached_data = self._load_ref_cache()
+            data, etag = await self.api_client.get_reference_data_list_if_changed(cached_etag)
             self.connection_status = "connected"
+            if data is None:
+                return cached_data
+            self._save_ref_cache(etag, data)
             return data if data else []
         except Exception as e:
             self.connection_status = "error"
             logger.error(f"Error loading reference data: {str(e)}")
             return []
-        finally:
-            if worker_api_client:
-                try:
-                    await worker_api_client.close()
-                except Exception as e:
-                    logger.error(f"Error closing worker API client: {e}")
+
+    def _load_ref_cache(self):
+        """Load the cached reference data list and its ETag from disk"""
+        try:
+            if os.path.exists(REFERENCE_CACHE_PATH):
+                with open(REFERENCE_CACHE_PATH, 'rb') as f:
+                    cache = pickle.load(f)
+                return cache.get('etag'), cache.get('data', [])
+        except Exception as e:
+            logger.error(f"Error loading reference data cache: {e}")
+        return None, []
+
+    def _save_ref_cache(self, etag, data):
+        """Persist the reference data list together with its ETag"""
+        if not etag:
+            return
+        try:
+            os.makedirs(os.path.dirname(REFERENCE_CACHE_PATH), exist_ok=True)
+            with open(REFERENCE_CACHE_PATH, 'wb') as f:
+                pickle.dump({'etag': etag, 'data': data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.error(f"Error saving reference data cache: {e}")
+
+    def _intern_categoricals(self, reference_data):
+        """Intern categorical fields so repeated values share a single string object"""
+        for data in reference_data:
+            for field in CATEGORICAL_FIELDS:
+                value = data.get(field)
+                if isinstance(value, str):
+                    data[field] = sys.intern(value)
+        return reference_data
+
+    def _build_reference_index(self):
+        """Index reference records by lowercased (product, lot, insertion) and by insertion"""
+        ref_index = defaultdict(list)
+        ref_by_insertion = defaultdict(list)
+        for data in self.reference_data:
+            product = (data.get('product') or '').lower()
+            lot = (data.get('lot') or '').lower()
+            insertion = (data.get('insertion') or '').lower()
+            ref_index[(product, lot, insertion)].append(data)
+            ref_by_insertion[insertion].append(data)
+        self._ref_index = dict(ref_index)
+        self._ref_by_insertion = dict(ref_by_insertion)
+
+        # Column-wise lowercased categoricals for vectorized filtering
+        self._ref_columns = {
+            field: np.array([str(data.get(field, '')).lower() for data in self.reference_data])
+            for field in CATEGORICAL_FIELDS
+        }
 
     def _update_reference_table(self, reference_data):
         try:
-            self.reference_data = reference_data if reference_data else []
+            self.reference_data = self._intern_categoricals(reference_data) if reference_data else []
+            self._build_reference_index()
+            self.distribution_comparator.clear_feature_cache()
                         
             if self.connection_status == "error":
                 self.add_status_message("Backend Connection", "Failed - Working in offline mode")
@@ -285,29 +632,34 @@ class RetrainingTab(QWidget):
         self._populate_summary_table()
 
     def _populate_summary_table(self):
-        self.summaryTable.setColumnCount(6)
-        self.summaryTable.setHorizontalHeaderLabels([
-            "Product", "Lot", "Insertion", "Test Count", "Model Version", "Created At"
-        ])
-        
-        self.summaryTable.setRowCount(len(self.data_summary))
-        for row, data in enumerate(self.data_summary):
-            self.summaryTable.setItem(row, 0, QTableWidgetItem(str(data.get('product', ''))))
-            self.summaryTable.setItem(row, 1, QTableWidgetItem(str(data.get('lot', ''))))
-            self.summaryTable.setItem(row, 2, QTableWidgetItem(str(data.get('insertion', ''))))
-            self.summaryTable.setItem(row, 3, QTableWidgetItem(str(data.get('test_count', 0))))
-            self.summaryTable.setItem(row, 4, QTableWidgetItem(str(data.get('model_version', 'v1'))))
+        table = self.summaryTable
+        sorting_enabled = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.setColumnCount(6)
+            table.setHorizontalHeaderLabels([
+                "Product", "Lot", "Insertion", "Test Count", "Model Version", "Created At"
+            ])
             
-            created_at = data.get('created_at', '')
-            if created_at:
-                try:
-                    dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    formatted_date = dt.strftime("%Y-%m-%d %H:%M")
-                except Exception:
-                    formatted_date = created_at
-                self.summaryTable.setItem(row, 5, QTableWidgetItem(formatted_date))
+            table.setRowCount(len(self.data_summary))
+            for row, data in enumerate(self.data_summary):
+                table.setItem(row, 0, QTableWidgetItem(str(data.get('product', ''))))
+                table.setItem(row, 1, QTableWidgetItem(str(data.get('lot', ''))))
+                table.setItem(row, 2, QTableWidgetItem(str(data.get('insertion', ''))))
+                table.setItem(row, 3, QTableWidgetItem(str(data.get('test_count', 0))))
+                table.setItem(row, 4, QTableWidgetItem(str(data.get('model_version', 'v1'))))
+                
+                created_at = data.get('created_at', '')
+                if created_at:
+                    table.setItem(row, 5, QTableWidgetItem(_format_created_at(created_at)))
+        finally:
+            table.blockSignals(False)
+            table.setSortingEnabled(sorting_enabled)
+            table.setUpdatesEnabled(True)
 
-        self.summaryTable.resizeColumnsToContents()
+        table.resizeColumnsToContents()
 
     def show_connection_error_in_table(self):
         self.summaryTable.setRowCount(1)
@@ -325,10 +677,13 @@ class RetrainingTab(QWidget):
             self._clear_filter_options()
             return
 
-        products = sorted(set(str(data.get('product', '')) for data in reference_data if data.get('product')))
-        lots = sorted(set(str(data.get('lot', '')) for data in reference_data if data.get('lot')))
-        test_names = sorted(set(str(data.get('test_name', '')) for data in reference_data if data.get('test_name')))
-        insertions = sorted(set(str(data.get('insertion', '')) for data in reference_data if data.get('insertion')))
+        options = {field: set() for field in CATEGORICAL_FIELDS}
+        for data in reference_data:
+            for field, values in options.items():
+                value = data.get(field)
+                if value:
+                    values.add(str(value))
+        products, lots, test_names, insertions = (sorted(options[field]) for field in CATEGORICAL_FIELDS)
 
         current_product = self.productFilter.currentText()
         current_lot = self.lotFilter.currentText()
@@ -363,23 +718,27 @@ class RetrainingTab(QWidget):
         if not reference_data:
             return []
 
-        filtered_data = reference_data
+        filter_values = zip(CATEGORICAL_FIELDS, (
+            self.productFilter.currentText(),
+            self.lotFilter.currentText(),
+            self.testFilter.currentText(),
+            self.insertionFilter.currentText()
+        ))
+        active_filters = [(field, value.lower()) for field, value in filter_values if value]
         
-        product_filter = self.productFilter.currentText()
-        lot_filter = self.lotFilter.currentText()
-        test_filter = self.testFilter.currentText()
-        insertion_filter = self.insertionFilter.currentText()
-
-        if product_filter:
-            filtered_data = [d for d in filtered_data if str(d.get('product', '')).lower() == product_filter.lower()]
-        if lot_filter:
-            filtered_data = [d for d in filtered_data if str(d.get('lot', '')).lower() == lot_filter.lower()]
-        if test_filter:
-            filtered_data = [d for d in filtered_data if str(d.get('test_name', '')).lower() == test_filter.lower()]
-        if insertion_filter:
-            filtered_data = [d for d in filtered_data if str(d.get('insertion', '')).lower() == insertion_filter.lower()]
+        if not active_filters:
+            return reference_data
+
+        if reference_data is self.reference_data and self._ref_columns:
+            mask = np.ones(len(reference_data), dtype=bool)
+            for field, value in active_filters:
+                mask &= self._ref_columns[field] == value
+            return [reference_data[i] for i in np.flatnonzero(mask)]
         
-        return filtered_data
+        return [
+            d for d in reference_data
+            if all(str(d.get(field, '')).lower() == value for field, value in active_filters)
+        ]
 
     def clear_filters(self):
         for combo in [self.productFilter, self.lotFilter, self.testFilter, self.insertionFilter]:
@@ -387,12 +746,7 @@ class RetrainingTab(QWidget):
         self.apply_filters()
 
     def check_existing_data(self, product, lot, insertion):
-        for data in self.reference_data:
-            if (data.get('product', '').lower() == product.lower() and
-                data.get('lot', '').lower() == lot.lower() and
-                data.get('insertion', '').lower() == insertion.lower()):
-                return True
-        return False
+        return (product.lower(), lot.lower(), insertion.lower()) in self._ref_index
 
     def add_reference_data(self):
         dialog = EFFUploadDialog(self)
@@ -467,38 +821,49 @@ class RetrainingTab(QWidget):
             worker.start()
 
     async def _async_delete_reference_data(self, product, lot, insertion):
-        from api.client import APIClient
-        
-        worker_api_client = None
+        worker_api_client = self.api_client
         try:
-            worker_api_client = APIClient()
-            
-            ids_to_delete = []
-            for data in self.reference_data:
-                if (data.get('product', '').lower() == product.lower() and
-                    data.get('lot', '').lower() == lot.lower() and
-                    data.get('insertion', '').lower() == insertion.lower()):
-                    ids_to_delete.append(data.get('reference_id', ''))
+            matches = self._ref_index.get((product.lower(), lot.lower(), insertion.lower()), [])
+            ids_to_delete = [data.get('reference_id', '') for data in matches]
+
+            if not ids_to_delete:
+                return 0
+
+            try:
+                result = await worker_api_client.delete_reference_data_batch(ids_to_delete)
+                return len(result.get('deleted', []))
+            except Exception as e:
+                # Older servers have no batch endpoint; fall back to single deletes.
+                # The route falls under /{reference_id}, which only allows GET/DELETE there,
+                # so a missing endpoint shows up as 405 as well as 404
+                response = getattr(e, 'response', None)
+                if response is None or response.status_code not in (404, 405):
+                    raise
+                logger.info("Batch delete endpoint not available, deleting records individually")
+
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+            async def delete_one(ref_id):
+                async with semaphore:
+                    return await worker_api_client.delete_reference_data(ref_id)
+
+            results = await asyncio.gather(
+                *(delete_one(ref_id) for ref_id in ids_to_delete),
+                return_exceptions=True
+            )
 
             deleted_count = 0
-            for ref_id in ids_to_delete:
-                try:
-                    await worker_api_client.delete_reference_data(ref_id)
+            for ref_id, result in zip(ids_to_delete, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error deleting reference data {ref_id}: {result}")
+                else:
                     deleted_count += 1
-                except Exception as e:
-                    logger.error(f"Error deleting reference data {ref_id}: {e}")
 
             return deleted_count
             
         except Exception as e:
             logger.error(f"Error deleting reference data: {str(e)}")
             raise
-        finally:
-            if worker_api_client:
-                try:
-                    await worker_api_client.close()
-                except Exception as e:
-                    logger.error(f"Error closing worker API client: {e}")
 
     def _handle_delete_complete(self, deleted_count):
         self.deleteBtn.setEnabled(True)
@@ -527,13 +892,20 @@ class RetrainingTab(QWidget):
             finally:
                 self.current_worker = None
 
+    def _emit_progress(self, pct, event, message):
+        """Forward worker progress, dropping updates that are too close together"""
+        now = time.monotonic()
+        if pct >= 100 or pct - self._last_pct >= 5 or now - self._last_emit > 0.1:
+            self.current_worker.progress.emit(pct, event, message)
+            self._last_pct = pct
+            self._last_emit = now
+
     async def _async_process_reference_data(self, file_path, product, lot, insertion, 
                                        use_for_retraining=False, update_existing=False):
-        from api.client import APIClient
-        
-        worker_api_client = None
+        worker_api_client = self.api_client
+        self._last_pct = 0
+        self._last_emit = 0.0
         try:
-            worker_api_client = APIClient()
             processor = EFFProcessor(worker_api_client)
             
             
@@ -544,7 +916,7 @@ class RetrainingTab(QWidget):
                 try:
                     # Validate we have reference data
                     if not self.reference_data:
-                        self.current_worker.progress.emit(
+                        self._emit_progress(
                             100, "VAMOS Analysis", 
                             "No reference data available for comparison"
                         )
@@ -552,37 +924,38 @@ class RetrainingTab(QWidget):
                         return eff_data
                     
                     # Find matching reference data
-                    self.current_worker.progress.emit(30, "VAMOS Analysis", "Finding matching reference data...")
+                    self._emit_progress(30, "VAMOS Analysis", "Finding matching reference data...")
                     
                     metadata = {'product': product, 'lot': lot, 'insertion': insertion}
                     best_match, match_score = self.distribution_comparator.find_best_match(
-                        metadata, self.reference_data
+                        metadata, self._ref_by_insertion.get(insertion.lower(), [])
                     )
                     
                     if best_match:
-                        self.current_worker.progress.emit(50, "VAMOS Analysis", 
-                                                        f"Found match with {match_score}% similarity")
+                        self._emit_progress(50, "VAMOS Analysis", 
+                                            f"Found match with {match_score}% similarity")
                         
                         # Calculate confidence with error handling
                         try:
                             confidence = self.distribution_comparator.calculate_confidence(
-                                eff_data, [best_match]
+                                eff_data, [best_match],
+                                ref_key=best_match.get('reference_id') or None
                             )
                         except Exception as e:
                             logger.error(f"Error calculating confidence: {e}")
-                            self.current_worker.progress.emit(
+                            self._emit_progress(
                                 100, "VAMOS Analysis", 
                                 "Error in distribution analysis"
                             )
                             return eff_data
                         
-                        self.current_worker.progress.emit(70, "VAMOS Analysis", 
-                                                        f"Distribution confidence: {confidence:.1f}%")
+                        self._emit_progress(70, "VAMOS Analysis", 
+                                            f"Distribution confidence: {confidence:.1f}%")
                         
                         if confidence >= 95:
                             # Trigger automatic retraining
-                            self.current_worker.progress.emit(80, "Model Training", 
-                                                            "High confidence detected - Starting automatic retraining...")
+                            self._emit_progress(80, "Model Training", 
+                                                "High confidence detected - Starting automatic retraining...")
                             
                             # Prepare training data with proper format
                             training_data = {
@@ -606,65 +979,62 @@ class RetrainingTab(QWidget):
                                     # Create new model version
                                     new_version = retrain_result.get('version', f'v{self.version_manager.current_version + 1}')
                                     
-                                    self.current_worker.progress.emit(90, "Model Training", 
-                                                                    f"Created model version {new_version}")
+                                    self._emit_progress(90, "Model Training", 
+                                                        f"Created model version {new_version}")
                                     
                                     # Update metrics
-                                    await worker_api_client.update_model_metrics({
+                                    follow_ups = [worker_api_client.update_model_metrics({
                                         'version': new_version,
                                         'confidence': confidence,
                                         'accuracy': retrain_result.get('metrics', {}).get('accuracy', 0),
                                         'training_data': metadata
-                                    })
+                                    })]
                                     
                                     # Mark reference data as used for training
                                     if best_match.get('reference_id'):
-                                        await worker_api_client.update_reference_data(
+                                        follow_ups.append(worker_api_client.update_reference_data(
                                             best_match['reference_id'],
                                             {
                                                 'used_for_training': True,
                                                 'training_version': new_version,
                                                 'quality_score': confidence
                                             }
-                                        )
+                                        ))
+                                    
+                                    # Both updates are independent, so issue them together
+                                    await asyncio.gather(*follow_ups)
                                     
                                     # Update local version manager
                                     version_num = int(new_version[1:]) if new_version.startswith('v') else 2
                                     self.version_manager.current_version = version_num
                                     
-                                    self.current_worker.progress.emit(100, "VAMOS Analysis", 
-                                                                    f"Training completed successfully - Model {new_version} created")
+                                    self._emit_progress(100, "VAMOS Analysis", 
+                                                        f"Training completed successfully - Model {new_version} created")
                                 else:
                                     error_msg = retrain_result.get('message', 'Unknown error')
-                                    self.current_worker.progress.emit(100, "Model Training", 
-                                                                    f"Training failed: {error_msg}")
+                                    self._emit_progress(100, "Model Training", 
+                                                        f"Training failed: {error_msg}")
                                     
                             except Exception as e:
                                 logger.error(f"Error during model retraining: {e}")
-                                self.current_worker.progress.emit(100, "Model Training", 
-                                                                f"Training error: {str(e)}")
+                                self._emit_progress(100, "Model Training", 
+                                                    f"Training error: {str(e)}")
                         else:
-                            self.current_worker.progress.emit(100, "VAMOS Analysis", 
-                                                            f"Confidence too low ({confidence:.1f}%) - Manual review required")
+                            self._emit_progress(100, "VAMOS Analysis", 
+                                                f"Confidence too low ({confidence:.1f}%) - Manual review required")
                     else:
-                        self.current_worker.progress.emit(100, "VAMOS Analysis", 
-                                                        "No matching reference data found with same insertion")
+                        self._emit_progress(100, "VAMOS Analysis", 
+                                            "No matching reference data found with same insertion")
                 except Exception as e:
                     logger.error(f"Error in VAMOS analysis: {e}", exc_info=True)
-                    self.current_worker.progress.emit(100, "VAMOS Analysis", 
-                                                    f"Analysis error: {str(e)}")
+                    self._emit_progress(100, "VAMOS Analysis", 
+                                        f"Analysis error: {str(e)}")
             
             return eff_data
             
         except Exception as e:
             logger.error("Error processing data: %s", str(e), exc_info=True)
             raise
-        finally:
-            if worker_api_client:
-                try:
-                    await worker_api_client.close()
-                except Exception as e:
-                    logger.error(f"Error closing worker API client: {e}")
 
     def _update_upload_progress(self, value, event, status):
         self.progressBar.setValue(value)
@@ -682,14 +1052,38 @@ class RetrainingTab(QWidget):
 
     def add_status_message(self, event: str, status: str):
         current_time = datetime.now().strftime("%H:%M:%S")
-        row_position = self.statusTable.rowCount()
-        self.statusTable.insertRow(row_position)
+        self._pending_status.append((current_time, event, status))
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _flush_status_messages(self):
+        if not self._pending_status:
+            return
         
-        self.statusTable.setItem(row_position, 0, QTableWidgetItem(current_time))
-        self.statusTable.setItem(row_position, 1, QTableWidgetItem(event))
-        self.statusTable.setItem(row_position, 2, QTableWidgetItem(status))
+        pending, self._pending_status = self._pending_status[-MAX_STATUS_ROWS:], []
+        table = self.statusTable
+        scrollbar = table.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 2
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            overflow = table.rowCount() + len(pending) - MAX_STATUS_ROWS
+            if overflow > 0:
+                table.model().removeRows(0, overflow)
+            
+            start = table.rowCount()
+            table.setRowCount(start + len(pending))
+            for i, (current_time, event, status) in enumerate(pending):
+                table.setItem(start + i, 0, QTableWidgetItem(current_time))
+                table.setItem(start + i, 1, QTableWidgetItem(event))
+                table.setItem(start + i, 2, QTableWidgetItem(status))
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
         
-        self.statusTable.scrollToBottom()
+        # Only follow new entries if the user hasn't scrolled up
+        if at_bottom:
+            table.scrollToBottom()
 
     def show_error(self, title: str, message: str):
         QMessageBox.critical(self, title, str(message))
@@ -699,33 +1093,26 @@ class RetrainingTab(QWidget):
     def closeEvent(self, event):        
         self._cleanup_current_worker()
         
-        for worker in self.workers[:]:
+        # Cancel every worker first so they wind down concurrently
+        for worker in self.workers:
+            worker.cancel()
+        
+        # Then wait against a single shared deadline
+        deadline = time.monotonic() + 2.0
+        while self.workers:
+            worker = self.workers.pop()
             try:
                 if worker.isRunning():
-                    worker.wait(2000)
+                    remaining = max(0, int((deadline - time.monotonic()) * 1000))
+                    worker.wait(remaining)
                 worker.deleteLater()
             except Exception as e:
                 logger.error(f"Error stopping worker: {str(e)}")
-        self.workers.clear()
         
         try:
-            import threading
-            
-            def close_main_api_client():
-                try:
-                    cleanup_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(cleanup_loop)
-                    cleanup_loop.run_until_complete(self.api_client.close())
-                    cleanup_loop.close()
-                except Exception as e:
-                    logger.error("Error during main API client cleanup: %s", str(e))
-            
-            cleanup_thread = threading.Thread(target=close_main_api_client)
-            cleanup_thread.start()
-            cleanup_thread.join(timeout=1.0)
-            
+            self.api_client.shutdown(timeout=5.0)
         except Exception as e:
-            logger.error("Error during cleanup thread: %s", str(e))
+            logger.error("Error during main API client cleanup: %s", str(e))
         
         event.accept()
 
@@ -741,41 +1128,11 @@ class RetrainingTab(QWidget):
         buttonsLayout = QHBoxLayout()
         
         self.addDataBtn = QPushButton("📁 Add Reference Data")
-        self.addDataBtn.setStyleSheet("""
-            QPushButton {
-                background-color: #1849D6;
-                color: white;
-                border-radius: 5px;
-                padding: 8px 15px;
-                font-weight: bold;
-                margin-right: 10px;
-            }
-            QPushButton:hover {
-                background-color: #0f3bb3;
-            }
-            QPushButton:disabled {
-                background-color: #CCCCCC;
-            }
-        """)
+        self.addDataBtn.setStyleSheet(_BTN_PRIMARY_QSS)
         self.addDataBtn.clicked.connect(self.add_reference_data)
         
         self.deleteBtn = QPushButton("🗑️ Delete Selected")
-        self.deleteBtn.setStyleSheet("""
-            QPushButton {
-                background-color: #FF0000;
-                color: white;
-                border-radius: 5px;
-                padding: 8px 15px;
-                font-weight: bold;
-                margin-right: 10px;
-            }
-            QPushButton:hover {
-                background-color: #CC0000;
-            }
-            QPushButton:disabled {
-                background-color: #CCCCCC;
-            }
-        """)
+        self.deleteBtn.setStyleSheet(_BTN_DANGER_QSS)
         self.deleteBtn.clicked.connect(self.delete_selected_data)
         
         buttonsLayout.addWidget(self.addDataBtn)
@@ -784,93 +1141,49 @@ class RetrainingTab(QWidget):
         
         # VAMOS Status Indicator
         self.vamos_status = QLabel("🔍 VAMOS: Ready")
-        self.vamos_status.setStyleSheet("""
-            QLabel {
-                background-color: #28a745;
-                color: white;
-                padding: 8px 15px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-        """)
+        self.vamos_status.setStyleSheet(_VAMOS_STATUS_QSS)
         buttonsLayout.addWidget(self.vamos_status)
         
         mainLayout.addLayout(buttonsLayout)
 
         # Progress bar
         self.progressBar = QProgressBar()
-        self.progressBar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #CCCCCC;
-                border-radius: 5px;
-                text-align: center;
-                height: 25px;
-                background-color: #f0f0f0;
-            }
-            QProgressBar::chunk {
-                background-color: #1849D6;
-                border-radius: 3px;
-            }
-        """)
+        self.progressBar.setStyleSheet(_PROGRESS_QSS)
         self.progressBar.setValue(0)
         self.progressBar.hide()
         mainLayout.addWidget(self.progressBar)
 
         # Filter section
         filterLabel = QLabel("Data Filters")
-        filterLabel.setFont(QFont("Arial", 10, QFont.Bold))
+        filterLabel.setFont(_font(10, bold=True))
         filterLabel.setStyleSheet("margin-top: 10px; margin-bottom: 5px;")
         mainLayout.addWidget(filterLabel)
         
         filterRowLayout = QHBoxLayout()
         
-        filter_style = """
-            QComboBox {
-                padding: 6px;
-                border: 1px solid #CCCCCC;
-                border-radius: 5px;
-                background-color: white;
-                min-width: 80px;
-            }
-            QComboBox:focus {
-                border-color: #1849D6;
-            }
-        """
-        
         self.productFilter = QComboBox()
         self.productFilter.setEditable(True)
-        self.productFilter.setStyleSheet(filter_style)
-        self.productFilter.currentTextChanged.connect(lambda: self.apply_filters())
+        self.productFilter.setStyleSheet(_COMBO_QSS)
+        self.productFilter.currentTextChanged.connect(lambda _=None: self._filter_timer.start())
         
         self.lotFilter = QComboBox()
         self.lotFilter.setEditable(True)
-        self.lotFilter.setStyleSheet(filter_style)
-        self.lotFilter.currentTextChanged.connect(lambda: self.apply_filters())
+        self.lotFilter.setStyleSheet(_COMBO_QSS)
+        self.lotFilter.currentTextChanged.connect(lambda _=None: self._filter_timer.start())
         
         self.testFilter = QComboBox()
         self.testFilter.setEditable(True)
-        self.testFilter.setStyleSheet(filter_style)
-        self.testFilter.currentTextChanged.connect(lambda: self.apply_filters())
+        self.testFilter.setStyleSheet(_COMBO_QSS)
+        self.testFilter.currentTextChanged.connect(lambda _=None: self._filter_timer.start())
         
         self.insertionFilter = QComboBox()
         self.insertionFilter.setEditable(True)
-        self.insertionFilter.setStyleSheet(filter_style)
-        self.insertionFilter.currentTextChanged.connect(lambda: self.apply_filters())
+        self.insertionFilter.setStyleSheet(_COMBO_QSS)
+        self.insertionFilter.currentTextChanged.connect(lambda _=None: self._filter_timer.start())
         
         self.clearFiltersBtn = QPushButton("Clear")
         self.clearFiltersBtn.clicked.connect(self.clear_filters)
-        self.clearFiltersBtn.setStyleSheet("""
-            QPushButton {
-                background-color: #FFA500;
-                color: white;
-                padding: 6px 12px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #e68a00;
-            }
-        """)
+        self.clearFiltersBtn.setStyleSheet(_BTN_CLEAR_QSS)
         
         filterRowLayout.addWidget(QLabel("Product:"))
         filterRowLayout.addWidget(self.productFilter)
@@ -887,35 +1200,12 @@ class RetrainingTab(QWidget):
 
         # Data summary table
         summaryLabel = QLabel("📊 Reference Data Summary")
-        summaryLabel.setFont(QFont("Arial", 10, QFont.Bold))
+        summaryLabel.setFont(_font(10, bold=True))
         summaryLabel.setStyleSheet("color: black; margin-top: 15px; margin-bottom: 10px;")
         mainLayout.addWidget(summaryLabel)
 
         self.summaryTable = QTableWidget()
-        self.summaryTable.setStyleSheet("""
-            QTableWidget {
-                border: 1px solid #CCCCCC;
-                border-radius: 5px;
-                gridline-color: #f0f0f0;
-                background-color: white;
-                selection-background-color: #1849D6;
-            }
-            QHeaderView::section {
-                background-color: #f8f9fa;
-                color: black;
-                padding: 8px;
-                border: 1px solid #CCCCCC;
-                font-weight: bold;
-            }
-            QTableWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #f0f0f0;
-            }
-            QTableWidget::item:selected {
-                background-color: #1849D6;
-                color: white;
-            }
-        """)
+        self.summaryTable.setStyleSheet(_TABLE_QSS)
         self.summaryTable.setSelectionBehavior(QTableWidget.SelectRows)
         self.summaryTable.setAlternatingRowColors(True)
         self.summaryTable.horizontalHeader().setStretchLastSection(True)
@@ -924,7 +1214,7 @@ class RetrainingTab(QWidget):
 
         # Status messages section
         statusLabel = QLabel("📋 VAMOS Operation Log")
-        statusLabel.setFont(QFont("Arial", 10, QFont.Bold))
+        statusLabel.setFont(_font(10, bold=True))
         statusLabel.setStyleSheet("color: black; margin-top: 15px; margin-bottom: 10px;")
         mainLayout.addWidget(statusLabel)
 
@@ -932,27 +1222,7 @@ class RetrainingTab(QWidget):
         self.statusTable.setColumnCount(3)
         self.statusTable.setHorizontalHeaderLabels(["Time", "Event", "Status"])
         self.statusTable.setMaximumHeight(150)
-        self.statusTable.setStyleSheet("""
-            QTableWidget {
-                border: 1px solid #CCCCCC;
-                border-radius: 5px;
-                gridline-color: #f0f0f0;
-                background-color: white;
-            }
-            QHeaderView::section {
-                background-color: #f8f9fa;
-                color: black;
-                padding: 6px;
-                border: 1px solid #CCCCCC;
-                font-weight: bold;
-                font-size: 9px;
-            }
-            QTableWidget::item {
-                padding: 4px;
-                border-bottom: 1px solid #f0f0f0;
-                font-size: 9px;
-            }
-        """)
+        self.statusTable.setStyleSheet(_STATUS_TABLE_QSS)
         self.statusTable.horizontalHeader().setStretchLastSection(True)
         self.statusTable.setSelectionBehavior(QTableWidget.SelectRows)
         mainLayout.addWidget(self.statusTable)
@@ -969,6 +1239,7 @@ class EFFUploadDialog(QWidget):
         self.parent = parent
         self.setWindowFlags(Qt.Dialog)
         self.data = {}
+        self._loop = None
         self.initUI()
     
     def initUI(self):
@@ -981,20 +1252,13 @@ class EFFUploadDialog(QWidget):
         
         # Title
         title = QLabel("Upload EFF File for Reference Data")
-        title.setFont(QFont("Arial", 14, QFont.Bold))
+        title.setFont(_font(14, bold=True))
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
         
         # File selection
         file_frame = QFrame()
-        file_frame.setStyleSheet("""
-            QFrame {
-                background-color: #f8f9fa;
-                border: 2px dashed #1849D6;
-                border-radius: 8px;
-                padding: 20px;
-            }
-        """)
+        file_frame.setStyleSheet(_FILE_FRAME_QSS)
         file_layout = QVBoxLayout(file_frame)
         
         self.file_label = QLabel("No file selected")
@@ -1025,19 +1289,7 @@ class EFFUploadDialog(QWidget):
         
         # VAMOS Retraining checkbox
         self.retrain_checkbox = QCheckBox("Use this data for automatic retraining (VAMOS)")
-        self.retrain_checkbox.setStyleSheet("""
-            QCheckBox {
-                font-weight: bold;
-                color: #1849D6;
-                padding: 10px;
-                background-color: #e3f2fd;
-                border-radius: 5px;
-            }
-            QCheckBox::indicator {
-                width: 20px;
-                height: 20px;
-            }
-        """)
+        self.retrain_checkbox.setStyleSheet(_RETRAIN_CHECKBOX_QSS)
         layout.addWidget(self.retrain_checkbox)
         
         # Info label
@@ -1055,21 +1307,7 @@ class EFFUploadDialog(QWidget):
         self.upload_btn = QPushButton("Upload")
         self.upload_btn.clicked.connect(self.accept)
         self.upload_btn.setEnabled(False)
-        self.upload_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1849D6;
-                color: white;
-                font-weight: bold;
-                padding: 8px 20px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #0f3bb3;
-            }
-            QPushButton:disabled {
-                background-color: #CCCCCC;
-            }
-        """)
+        self.upload_btn.setStyleSheet(_BTN_UPLOAD_QSS)
         
         button_layout.addWidget(cancel_btn)
         button_layout.addWidget(self.upload_btn)
@@ -1078,20 +1316,10 @@ class EFFUploadDialog(QWidget):
     
     def create_input_field(self, label_text):
         label = QLabel(label_text)
-        label.setFont(QFont("Arial", 10))
+        label.setFont(_font(10))
         
         input_field = QLineEdit()
-        input_field.setStyleSheet("""
-            QLineEdit {
-                padding: 8px;
-                border: 1px solid #CCCCCC;
-                border-radius: 5px;
-                font-size: 12px;
-            }
-            QLineEdit:focus {
-                border-color: #1849D6;
-            }
-        """)
+        input_field.setStyleSheet(_LINEEDIT_QSS)
         input_field.textChanged.connect(self.validate_inputs)
         
         return label, input_field
@@ -1122,18 +1350,26 @@ class EFFUploadDialog(QWidget):
         self.data['lot'] = self.lot_input[1].text().strip()
         self.data['insertion'] = self.insertion_input[1].text().strip()
         self.data['use_for_retraining'] = self.retrain_checkbox.isChecked()
-        self.close()
         self.parent.dialog_result = True
+        self.close()
     
     def reject(self):
-        self.close()
         self.parent.dialog_result = False
+        self.close()
+    
+    def closeEvent(self, event):
+        if self._loop is not None:
+            self._loop.quit()
+        super().closeEvent(event)
     
     def exec_(self):
         self.parent.dialog_result = False
+        self._loop = QEventLoop(self)
+        self.destroyed.connect(self._loop.quit)
+        self.setWindowModality(Qt.ApplicationModal)
         self.show()
-        while self.isVisible():
-            QApplication.processEvents()
+        self._loop.exec_()
+        self._loop = None
         return self.parent.dialog_result
     
     def get_data(self):
@@ -1,28 +1,186 @@
 from PySide6.QtWidgets import (QWidget, QLabel, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit,
-                               QFileDialog, QFrame, QScrollArea, QMessageBox, QGroupBox, QComboBox)
-from PySide6.QtGui import QPixmap, QFont, QDragEnterEvent, QDropEvent, QIcon
-from PySide6.QtCore import Qt, Signal
+                               QFileDialog, QFrame, QScrollArea, QMessageBox, QGroupBox, QComboBox,
+                               QFileIconProvider, QStyle, QApplication, QListView, QStyledItemDelegate)
+from PySide6.QtGui import QPixmap, QFont, QDragEnterEvent, QDropEvent, QIcon, QPainter, QColor, QPen
+from PySide6.QtCore import (Qt, Signal, QThreadPool, QTimer, QObject, QRunnable,
+                            QAbstractListModel, QModelIndex, QSize, QRect, QRectF, QEvent)
 from typing import List, Dict
 import os
+import stat
+import shutil
 import zipfile
+import zlib
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 import pickle
+import mmap
 import datetime
 from ui.utils.EFFExtractor import EFFExtractor, ExtractorType
 from ui.utils.ExtractionWorker import ExtractionWorker
 from ui.utils.EFFValidator import EFFValidator
 from ui.utils.PathResources import resource_path
 
+# File types accepted by drag and drop, mapped to their row icon
+_EXT_TO_ICON = {'.zip': 'ZIP.png', '.eff': 'EFF.png', '.tsf': 'TSF.png'}
+_ALLOWED_EXTS = frozenset(_EXT_TO_ICON)
+# Members pulled out of dropped archives
+_DATA_EXTS = frozenset({'.eff', '.tsf'})
+
+def _file_ext(path):
+    """Lowercased extension, so .EFF and .eff are treated alike"""
+    return os.path.splitext(path)[1].lower()
+
+# The file list paints its own rows, so the view itself stays unstyled
+_FILE_LIST_VIEW_QSS = "QListView { background: transparent; border: none; }"
+
+# Widget styles, built once at import instead of per instance
+_LOT_LINEEDIT_QSS = "border-radius: 5px; background-color: #F0F0F0; min-height: 30px; padding: 5px;"
+_BTN_ICON_QSS = "QPushButton { border: none; } QPushButton:hover { background-color: #f0f0f0; }"
+_BTN_ADD_INSERTION_QSS = "QPushButton { color: #1849D6; border: none; text-align: left; }"
+_INSERTION_LINEEDIT_QSS = "border-radius: 5px; background-color: #F0F0F0; min-height: 25px; padding: 3px;"
+_BTN_REMOVE_QSS = "QPushButton { background-color: #FF4444; color: white; border-radius: 3px; }"
+
+_BTN_SETTINGS_QSS = """
+    QPushButton {
+        background-color: #6C757D;
+        color: white;
+        border-radius: 5px;
+        padding: 5px 15px;
+        margin-right: 5px;
+    }
+    QPushButton:hover {
+        background-color: #5A6268;
+    }
+"""
+
+_BTN_PROCEED_QSS = """
+    QPushButton {
+        background-color: #1849D6;
+        color: white;
+        border-radius: 5px;
+        padding: 5px 15px;
+    }
+    QPushButton:disabled {
+        background-color: grey;
+    }
+"""
+
+_BTN_ADMIN_QSS = """
+    QPushButton {
+        background-color: #FF0000;
+        color: white;
+        border-radius: 5px;
+        padding: 5px 15px;
+        margin-left: 5px;
+    }
+    QPushButton:hover {
+        background-color: #CC0000;
+    }
+"""
+
+_IMPORT_SECTION_QSS = """
+    border: 2px solid #17A2B8;
+    background-color: #F8F9FA;
+    border-radius: 5px;
+    padding: 10px;
+"""
+
+_BTN_IMPORT_QSS = """
+    QPushButton {
+        background-color: #17A2B8;
+        color: white;
+        border-radius: 5px;
+        padding: 8px 15px;
+        margin: 5px;
+    }
+    QPushButton:hover {
+        background-color: #138496;
+    }
+"""
+
+_DRAG_DROP_QSS = """
+    border: 2px dashed #1849D6;
+    background-color: white;
+    border-radius: 5px;
+"""
+
+_BTN_LINK_QSS = """
+    QPushButton {
+        border: none;
+        color: #1849D6;
+        text-align: left;
+        padding-left: 5px;
+    }
+"""
+
+_BTN_EXTRACT_QSS = """
+    QPushButton {
+        background-color: #1FBE42;
+        color: white;
+        border-radius: 5px;
+        padding: 5px 15px;
+        min-width: 40px;
+        margin-top: 20px;
+    }
+    QPushButton:disabled {
+        background-color: grey;
+    }
+"""
+
+_BTN_CLEAR_QSS = """
+    QPushButton {
+        background-color: transparent;
+        color: #FF0000;
+        border: 1px solid #FF0000;
+        border-radius: 5px;
+        padding: 5px 15px;
+    }
+"""
+
+def _fit_pixmap(pixmap, size):
+    """Scale a pixmap to fit size x size, skipping the resample if it already fits"""
+    if max(pixmap.width(), pixmap.height()) == size:
+        return pixmap
+    return pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+# Decoded icons shared by every page instance
+_ICON_CACHE: Dict[str, QIcon] = {}
+_PIXMAP_CACHE: Dict[tuple, QPixmap] = {}
+
+def _cached_icon(path):
+    """QIcon for path, loaded once per process"""
+    icon = _ICON_CACHE.get(path)
+    if icon is None:
+        icon = QIcon(path)
+        if QApplication.instance() is not None:
+            _ICON_CACHE[path] = icon
+    return icon
+
+def _cached_pixmap(path, size):
+    """Pixmap for path scaled to fit size x size, loaded once per process"""
+    key = (path, size)
+    pixmap = _PIXMAP_CACHE.get(key)
+    if pixmap is None:
+        pixmap = _fit_pixmap(QPixmap(path), size)
+        if QApplication.instance() is not None:
+            _PIXMAP_CACHE[key] = pixmap
+    return pixmap
+
 class LotInputWithInsertion(QWidget):
     deleted = Signal(object)
+    changed = Signal()
     
     def __init__(self, delete_icon_path, is_frontend=False):
         super().__init__()
         self.is_frontend = is_frontend
         self.delete_icon_path = delete_icon_path
-        self.insertion_inputs = []
+        self.insertion_rows = []
         self.initUI()
     
+    @property
+    def insertion_inputs(self):
+        return [row[1] for row in self.insertion_rows]
+    
     def initUI(self):
         mainLayout = QVBoxLayout(self)
         mainLayout.setContentsMargins(0, 5, 0, 5)
@@ -31,18 +189,20 @@ class LotInputWithInsertion(QWidget):
         
         self.input = QLineEdit()
         self.input.setPlaceholderText('Lot Number')
-        self.input.setStyleSheet("border-radius: 5px; background-color: #F0F0F0; min-height: 30px; padding: 5px;")
+        self.input.setStyleSheet(_LOT_LINEEDIT_QSS)
+        self.input.textChanged.connect(self.changed)
         firstRowLayout.addWidget(self.input)
         
         if self.is_frontend:
             self.wafer_input = QLineEdit()
             self.wafer_input.setPlaceholderText('Wafer')
-            self.wafer_input.setStyleSheet("border-radius: 5px; background-color: #F0F0F0; min-height: 30px; padding: 5px;")
+            self.wafer_input.setStyleSheet(_LOT_LINEEDIT_QSS)
+            self.wafer_input.textChanged.connect(self.changed)
             firstRowLayout.addWidget(self.wafer_input)
         
         self.deleteBtn = QPushButton()
         self.deleteBtn.setFixedSize(30, 30)
-        self.deleteBtn.setStyleSheet("QPushButton { border: none; } QPushButton:hover { background-color: #f0f0f0; }")
+        self.deleteBtn.setStyleSheet(_BTN_ICON_QSS)
         self.deleteBtn.clicked.connect(lambda: self.deleted.emit(self))
         firstRowLayout.addWidget(self.deleteBtn)
         
@@ -57,7 +217,7 @@ class LotInputWithInsertion(QWidget):
         mainLayout.addLayout(self.insertionLayout)
         
         self.addInsertionBtn = QPushButton("Add Insertion")
-        self.addInsertionBtn.setStyleSheet("QPushButton { color: #1849D6; border: none; text-align: left; }")
+        self.addInsertionBtn.setStyleSheet(_BTN_ADD_INSERTION_QSS)
         self.addInsertionBtn.clicked.connect(self.add_insertion)
         mainLayout.addWidget(self.addInsertionBtn)
         
@@ -70,42 +230,287 @@ class LotInputWithInsertion(QWidget):
         insertionLayout.setSpacing(5)
         
         insertionInput = QLineEdit()
-        insertionInput.setPlaceholderText(f'Insertion {len(self.insertion_inputs) + 1}')
-        insertionInput.setStyleSheet("border-radius: 5px; background-color: #F0F0F0; min-height: 25px; padding: 3px;")
+        insertionInput.setPlaceholderText(f'Insertion {len(self.insertion_rows) + 1}')
+        insertionInput.setStyleSheet(_INSERTION_LINEEDIT_QSS)
+        insertionInput.textChanged.connect(self.changed)
         
         removeBtn = QPushButton("Remove")
         removeBtn.setFixedSize(60, 25)
-        removeBtn.setStyleSheet("QPushButton { background-color: #FF4444; color: white; border-radius: 3px; }")
+        removeBtn.setStyleSheet(_BTN_REMOVE_QSS)
         removeBtn.clicked.connect(lambda: self.remove_insertion(insertionWidget, insertionInput))
         
         insertionLayout.addWidget(insertionInput)
         insertionLayout.addWidget(removeBtn)
         
         self.insertionLayout.addWidget(insertionWidget)
-        self.insertion_inputs.append(insertionInput)
+        self.insertion_rows.append((insertionWidget, insertionInput, removeBtn))
         
         self.update_remove_buttons()
     
     def remove_insertion(self, widget, input_field):
-        if len(self.insertion_inputs) > 1:
-            self.insertion_inputs.remove(input_field)
+        if len(self.insertion_rows) > 1:
+            self.insertion_rows = [row for row in self.insertion_rows if row[1] is not input_field]
             widget.deleteLater()
             self.update_remove_buttons()
+            self.changed.emit()
     
     def update_remove_buttons(self):
-        for i, widget in enumerate(self.insertionLayout.parentWidget().findChildren(QWidget)):
-            if hasattr(widget, 'layout') and widget.layout():
-                remove_btn = None
-                for j in range(widget.layout().count()):
-                    item = widget.layout().itemAt(j)
-                    if item and isinstance(item.widget(), QPushButton) and item.widget().text() == "Remove":
-                        remove_btn = item.widget()
-                        break
-                if remove_btn:
-                    remove_btn.setVisible(len(self.insertion_inputs) > 1)
+        visible = len(self.insertion_rows) > 1
+        for _, _, remove_btn in self.insertion_rows:
+            remove_btn.setVisible(visible)
     
     def get_insertions(self):
-        return [inp.text().strip() for inp in self.insertion_inputs if inp.text().strip()]
+        return [text for inp in self.insertion_inputs if (text := inp.text().strip())]
+
+class _PickleLoaderSignals(QObject):
+    loaded = Signal(object)
+    failed = Signal(str)
+
+class _PickleLoader(QRunnable):
+    """Unpickle a file on a pool thread and report the result through signals"""
+    
+    def __init__(self, path):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.path = path
+        self.signals = _PickleLoaderSignals()
+    
+    def run(self):
+        try:
+            with open(self.path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data = pickle.load(mm)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.loaded.emit(data)
+
+def _already_extracted(extract_path, file_info):
+    """Check whether a previous run already wrote this member, size first then CRC"""
+    try:
+        if os.path.getsize(extract_path) != file_info.file_size:
+            return False
+    except OSError:
+        return False
+    
+    crc = 0
+    with open(extract_path, 'rb') as f:
+        while chunk := f.read(1024 * 1024):
+            crc = zlib.crc32(chunk, crc)
+    return crc == file_info.CRC
+
+def _extract_member(zip_path, file_info, extract_path):
+    # ZipFile is not safe to read from several threads, so each task opens its own
+    if _already_extracted(extract_path, file_info):
+        return extract_path
+    # A 1 MiB read buffer keeps the syscall count low on network mounts
+    with open(zip_path, 'rb', buffering=1024 * 1024) as raw, zipfile.ZipFile(raw, 'r') as zip_ref:
+        with zip_ref.open(file_info) as source, open(extract_path, 'wb') as target:
+            shutil.copyfileobj(source, target, length=1024 * 1024)
+    return extract_path
+
+def _unique_extract_path(temp_dir, member_name, taken):
+    """Flat target path for a member, suffixed when another member already claimed its name"""
+    name = os.path.basename(member_name)
+    stem, ext = os.path.splitext(name)
+    candidate = name
+    counter = 1
+    while os.path.normcase(candidate) in taken:
+        candidate = f"{stem} ({counter}){ext}"
+        counter += 1
+    taken.add(os.path.normcase(candidate))
+    return os.path.join(temp_dir, candidate)
+
+def _extract_zip(zip_path, temp_dir, taken=None):
+    """Extract the .eff/.tsf members of a ZIP into temp_dir in parallel, returning their paths and errors"""
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        members = [info for info in zip_ref.infolist() if _file_ext(info.filename) in _DATA_EXTS]
+    
+    if not members:
+        return [], []
+    
+    # Targets are assigned up front so no two tasks ever write the same file,
+    # e.g. a/X.eff and b/X.eff extract to X.eff and X (1).eff
+    taken = set() if taken is None else taken
+    targets = [_unique_extract_path(temp_dir, info.filename, taken) for info in members]
+    
+    files, errors = [], []
+    with ThreadPoolExecutor(max_workers=min(8, len(members), os.cpu_count() or 4)) as executor:
+        futures = [(info, executor.submit(_extract_member, zip_path, info, target))
+                   for info, target in zip(members, targets)]
+        # A bad member is reported on its own and the rest of the archive still extracts
+        for info, future in futures:
+            try:
+                files.append(future.result())
+            except Exception as e:
+                errors.append(f"Failed to extract {info.filename} from {zip_path}: {str(e)}")
+    return files, errors
+
+class _ZipExtractSignals(QObject):
+    progress = Signal(int)
+    finished = Signal(list, list)
+
+class _ZipExtractJob(QRunnable):
+    """Resolve uploaded paths to data files, extracting ZIPs on a pool thread"""
+    
+    def __init__(self, paths, temp_dir):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.paths = paths
+        self.temp_dir = temp_dir
+        self.signals = _ZipExtractSignals()
+    
+    def run(self):
+        files, errors = [], []
+        total = sum(1 for path in self.paths if _file_ext(path) == '.zip')
+        done = 0
+        # Extracted names claimed so far, shared so archives in one job don't overwrite each other
+        taken = set()
+        for path in self.paths:
+            if _file_ext(path) != '.zip':
+                files.append(path)
+                continue
+            try:
+                extracted, member_errors = _extract_zip(path, self.temp_dir, taken)
+                files.extend(extracted)
+                errors.extend(member_errors)
+            except Exception as e:
+                errors.append(f"Failed to extract {path}: {str(e)}")
+            done += 1
+            self.signals.progress.emit(int(done * 100 / total))
+        self.signals.finished.emit(files, errors)
+
+class ClickableWidget(QWidget):
+    clicked = Signal()
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # QWidget subclasses only paint stylesheet background/border rules when asked to
+        self.setAttribute(Qt.WA_StyledBackground, True)
+    
+    def mousePressEvent(self, event):
+        self.clicked.emit()
+        super().mousePressEvent(event)
+
+class UploadedFilesModel(QAbstractListModel):
+    """Uploaded files as (path, name, size in KB) rows, in the order they were added"""
+    PathRole = Qt.UserRole
+    SizeRole = Qt.UserRole + 1
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._paths = set()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        path, name, size = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return name
+        if role in (self.PathRole, Qt.ToolTipRole):
+            return path
+        if role == self.SizeRole:
+            return size
+        return None
+    
+    def contains(self, path):
+        return path in self._paths
+    
+    def paths(self):
+        return [row[0] for row in self._rows]
+    
+    def add_files(self, rows):
+        """Append new rows with a single insertion notification"""
+        rows = [row for row in rows if row[0] not in self._paths]
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self._paths.update(row[0] for row in rows)
+        self.endInsertRows()
+    
+    def remove_file(self, path):
+        if path not in self._paths:
+            return
+        row = next(i for i, entry in enumerate(self._rows) if entry[0] == path)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self._paths.discard(path)
+        self.endRemoveRows()
+    
+    def clear(self):
+        self.beginResetModel()
+        self._rows.clear()
+        self._paths.clear()
+        self.endResetModel()
+
+class FileRowDelegate(QStyledItemDelegate):
+    """Paint an uploaded file row (icon, name, size, delete icon) without per-row widgets"""
+    deleteRequested = Signal(str)
+    
+    ROW_HEIGHT = 64
+    ICON_SIZE = 40
+    DELETE_SIZE = 20
+    
+    def __init__(self, icons, parent=None):
+        super().__init__(parent)
+        self.icons = icons
+    
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+    
+    def _row_rect(self, option):
+        return option.rect.adjusted(0, 2, 0, -2)
+    
+    def _delete_rect(self, rect):
+        return QRect(rect.right() - 10 - self.DELETE_SIZE, rect.center().y() - self.DELETE_SIZE // 2,
+                     self.DELETE_SIZE, self.DELETE_SIZE)
+    
+    def paint(self, painter, option, index):
+        path = index.data(UploadedFilesModel.PathRole)
+        rect = self._row_rect(option)
+        deleteRect = self._delete_rect(rect)
+        
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(QColor("#E0E0E0"), 1))
+        painter.setBrush(QColor("white"))
+        painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 5, 5)
+        
+        icon = self.icons.get(_file_ext(path), self.icons['default'])
+        iconLeft = rect.left() + 10 + (self.ICON_SIZE - icon.width()) // 2
+        painter.drawPixmap(iconLeft, rect.center().y() - icon.height() // 2, icon)
+        
+        textLeft = rect.left() + 20 + self.ICON_SIZE
+        textWidth = deleteRect.left() - 10 - textLeft
+        half = rect.height() // 2
+        
+        painter.setPen(QColor("black"))
+        painter.setFont(option.font)
+        title = option.fontMetrics.elidedText(index.data(Qt.DisplayRole), Qt.ElideMiddle, textWidth)
+        painter.drawText(QRect(textLeft, rect.top(), textWidth, half), Qt.AlignLeft | Qt.AlignBottom, title)
+        
+        sizeFont = QFont(option.font)
+        sizeFont.setPixelSize(10)
+        painter.setPen(QColor("gray"))
+        painter.setFont(sizeFont)
+        painter.drawText(QRect(textLeft, rect.top() + half, textWidth, rect.height() - half),
+                         Qt.AlignLeft | Qt.AlignTop, f"{index.data(UploadedFilesModel.SizeRole):.2f} KB")
+        
+        painter.drawPixmap(deleteRect, self.icons['delete'])
+        painter.restore()
+    
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton
+                and self._delete_rect(self._row_rect(option)).contains(event.position().toPoint())):
+            self.deleteRequested.emit(index.data(UploadedFilesModel.PathRole))
+            return True
+        return super().editorEvent(event, model, option, index)
 
 class UploadPage(QWidget):
     show_selection_signal = Signal(list) 
@@ -115,20 +520,43 @@ class UploadPage(QWidget):
 
     def __init__(self):
         super().__init__()
-        self.uploaded_files = []
+        self.fileModel = UploadedFilesModel(self)
         self.progress_widgets = {}
-        self.active_workers = []
-        self.current_extraction_index = 0
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(min(8, os.cpu_count() or 4))
+        self._pending = 0
+        self.extraction_workers = set()
+        self._output_files_cache = set()
+        self._cache_dirty = True
+        self._last_check_key = None
         self.chips_to_process = []
         self.lot_inputs = []
         self.extracted_files = []
         
         self.upload_dir = os.path.dirname(os.path.dirname(__file__))
         self.output_dir = resource_path(os.path.join('./resources/output'))
-        self.temp_dir = tempfile.mkdtemp()
+        self._temp_dir_ctx = tempfile.TemporaryDirectory(prefix='flow_upload_')
+        self.temp_dir = self._temp_dir_ctx.name
         self.add_icon = resource_path(os.path.join('./resources/icons', 'add.png'))
         self.delete_icon = resource_path(os.path.join('./resources/icons', 'delete.png'))
         self.substruct_icon = resource_path(os.path.join('./resources/icons', 'substruct.png'))
+        self._icon_cache = self._load_file_icons()
+        self._file_dialog = None
+        self._dashboard_loader = None
+        self._zip_job = None
+        
+        # Lot/insertion edits are validated once typing pauses
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(150)
+        self._validate_timer.timeout.connect(self.validate_inputs)
+        
+        # Files reported by extraction workers are added in batches
+        self._pending_files = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(100)
+        self._flush_timer.timeout.connect(self._flush_pending)
         
         self.extractors = {
             'backend': EFFExtractor(ExtractorType.BACKEND),
@@ -149,7 +577,7 @@ class UploadPage(QWidget):
         
         scrollArea = QScrollArea()
         scrollArea.setWidgetResizable(True)
-        scrollArea.setStyleSheet("QScrollArea { border: none; }")
+        scrollArea.setFrameShape(QFrame.NoFrame)
         
         scrollContent = QWidget()
         scrollLayout = QVBoxLayout(scrollContent)
@@ -158,7 +586,7 @@ class UploadPage(QWidget):
         self.setupDashboardImportSection(scrollLayout)
         self.setupDragDropSection(scrollLayout)
         self.setupSeparator(scrollLayout)
-        self.setupLotBasedSection(scrollLayout)
+        self.setupLotBasedPlaceholder(scrollLayout)
         self.setupFileListSection(scrollLayout)
         
         scrollArea.setWidget(scrollContent)
@@ -187,52 +615,20 @@ class UploadPage(QWidget):
         try:
             settings_icon = resource_path(os.path.join('./resources/icons', 'settings.png'))
             if os.path.exists(settings_icon):
-                self.settingsButton.setIcon(QIcon(settings_icon))
+                self.settingsButton.setIcon(_cached_icon(settings_icon))
         except:
             pass
         
-        self.settingsButton.setStyleSheet("""
-            QPushButton {
-                background-color: #6C757D;
-                color: white;
-                border-radius: 5px;
-                padding: 5px 15px;
-                margin-right: 5px;
-            }
-            QPushButton:hover {
-                background-color: #5A6268;
-            }
-        """)
+        self.settingsButton.setStyleSheet(_BTN_SETTINGS_QSS)
         self.settingsButton.clicked.connect(self.show_settings)
         
         self.proceedButton = QPushButton("Proceed")
-        self.proceedButton.setStyleSheet("""
-            QPushButton {
-                background-color: #1849D6;
-                color: white;
-                border-radius: 5px;
-                padding: 5px 15px;
-            }
-            QPushButton:disabled {
-                background-color: grey;
-            }
-        """)
+        self.proceedButton.setStyleSheet(_BTN_PROCEED_QSS)
         self.proceedButton.setEnabled(False)
         self.proceedButton.clicked.connect(self.on_proceed_clicked)
         
         self.adminButton = QPushButton("Admin")
-        self.adminButton.setStyleSheet("""
-            QPushButton {
-                background-color: #FF0000;
-                color: white;
-                border-radius: 5px;
-                padding: 5px 15px;
-                margin-left: 5px;
-            }
-            QPushButton:hover {
-                background-color: #CC0000;
-            }
-        """)
+        self.adminButton.setStyleSheet(_BTN_ADMIN_QSS)
         self.adminButton.clicked.connect(self.show_admin_login)
         
         row1.addLayout(titleLayout)
@@ -252,12 +648,7 @@ class UploadPage(QWidget):
     def setupDashboardImportSection(self, mainLayout):
         """Setup import dashboard section"""
         importSection = QWidget()
-        importSection.setStyleSheet("""
-            border: 2px solid #17A2B8;
-            background-color: #F8F9FA;
-            border-radius: 5px;
-            padding: 10px;
-        """)
+        importSection.setStyleSheet(_IMPORT_SECTION_QSS)
         importSection.setFixedHeight(80)
         
         importLayout = QHBoxLayout(importSection)
@@ -282,18 +673,7 @@ class UploadPage(QWidget):
         importTextLayout.addWidget(importSubtext)
         importTextLayout.setSpacing(0)
         self.importDashboardButton = QPushButton("Import Dashboard")
-        self.importDashboardButton.setStyleSheet("""
-            QPushButton {
-                background-color: #17A2B8;
-                color: white;
-                border-radius: 5px;
-                padding: 8px 15px;
-                margin: 5px;
-            }
-            QPushButton:hover {
-                background-color: #138496;
-            }
-        """)
+        self.importDashboardButton.setStyleSheet(_BTN_IMPORT_QSS)
         self.importDashboardButton.clicked.connect(self.importDashboard)
         
         importLayout.addWidget(importIcon)
@@ -316,67 +696,71 @@ class UploadPage(QWidget):
             "Dashboard Files (*.pkl)"
         )
         if path:
-            try:
-                with open(path, 'rb') as f:
-                    dashboard_data = pickle.load(f)
-                
-                # Validate dashboard data structure
-                if not isinstance(dashboard_data, dict):
-                    raise ValueError("Invalid dashboard file format")
-                
-                required_keys = ['data', 'visible_columns', 'all_columns', 'table_data', 'metadata']
-                if not all(key in dashboard_data for key in required_keys):
-                    raise ValueError("Dashboard file is missing required data")
-                
-                # Show confirmation dialog
-                metadata = dashboard_data.get('metadata', {})
-                export_date = metadata.get('export_date', 'Unknown')
-                rows = metadata.get('rows', 0)
-                columns = metadata.get('columns', 0)
-                
-                reply = QMessageBox.question(
-                    self,
-                    "Import Dashboard",
-                    f"Dashboard Information:\n"
-                    f"Export Date: {export_date}\n"
-                    f"Rows: {rows}\n"
-                    f"Columns: {columns}\n\n"
-                    f"Do you want to import this dashboard?",
-                    QMessageBox.Yes | QMessageBox.No
-                )
-                
-                if reply == QMessageBox.Yes:
-                    # Emit signal to load dashboard
-                    self.load_dashboard_signal.emit(dashboard_data)
-                    
-                    QMessageBox.information(
-                        self,
-                        "Import Successful",
-                        "Dashboard imported successfully!"
-                    )
+            # Unpickle off the GUI thread; results come back through queued signals
+            self._dashboard_loader = _PickleLoader(path)
+            self._dashboard_loader.signals.loaded.connect(self._on_dashboard_loaded, Qt.QueuedConnection)
+            self._dashboard_loader.signals.failed.connect(self._on_dashboard_failed, Qt.QueuedConnection)
+            QThreadPool.globalInstance().start(self._dashboard_loader)
+
+    def _on_dashboard_loaded(self, dashboard_data):
+        self._dashboard_loader = None
+        try:
+            # Validate dashboard data structure
+            if not isinstance(dashboard_data, dict):
+                raise ValueError("Invalid dashboard file format")
+            
+            required_keys = ['data', 'visible_columns', 'all_columns', 'table_data', 'metadata']
+            if not all(key in dashboard_data for key in required_keys):
+                raise ValueError("Dashboard file is missing required data")
+            
+            # Show confirmation dialog
+            metadata = dashboard_data.get('metadata', {})
+            export_date = metadata.get('export_date', 'Unknown')
+            rows = metadata.get('rows', 0)
+            columns = metadata.get('columns', 0)
+            
+            reply = QMessageBox.question(
+                self,
+                "Import Dashboard",
+                f"Dashboard Information:\n"
+                f"Export Date: {export_date}\n"
+                f"Rows: {rows}\n"
+                f"Columns: {columns}\n\n"
+                f"Do you want to import this dashboard?",
+                QMessageBox.Yes | QMessageBox.No
+            )
+            
+            if reply == QMessageBox.Yes:
+                # Emit signal to load dashboard
+                self.load_dashboard_signal.emit(dashboard_data)
                 
-            except Exception as e:
-                QMessageBox.critical(
+                QMessageBox.information(
                     self,
-                    "Import Failed",
-                    f"Failed to import dashboard:\n{str(e)}"
+                    "Import Successful",
+                    "Dashboard imported successfully!"
                 )
+            
+        except Exception as e:
+            self._on_dashboard_failed(str(e))
+
+    def _on_dashboard_failed(self, message):
+        self._dashboard_loader = None
+        QMessageBox.critical(
+            self,
+            "Import Failed",
+            f"Failed to import dashboard:\n{message}"
+        )
 
     def setupDragDropSection(self, mainLayout):
-        self.dragDropSection = QWidget()
-        self.dragDropSection.setStyleSheet("""
-            border: 2px dashed #1849D6;
-            background-color: white;
-            border-radius: 5px;
-        """)
+        self.dragDropSection = ClickableWidget()
+        self.dragDropSection.setStyleSheet(_DRAG_DROP_QSS)
         self.dragDropSection.setFixedHeight(150)
         self.dragDropSection.setAcceptDrops(True)
         
         dragDropLayout = QVBoxLayout(self.dragDropSection)
         
         uploadIcon = QLabel()
-        iconPixmap = QPixmap(resource_path('./resources/icons/upload.png'))
-        iconPixmap = iconPixmap.scaled(30, 30, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        iconPixmap = _cached_pixmap(resource_path('./resources/icons/upload.png'), 30)
         uploadIcon.setPixmap(iconPixmap)
         uploadIcon.setStyleSheet("border : none")
         uploadIcon.setAlignment(Qt.AlignCenter)
@@ -395,7 +779,7 @@ class UploadPage(QWidget):
         message.setStyleSheet("color: gray; margin-top: 0px; margin-bottom: 30px;")
         mainLayout.addWidget(message)
         
-        self.dragDropSection.mousePressEvent = self.openFileDialog
+        self.dragDropSection.clicked.connect(self.openFileDialog)
 
     def setupSeparator(self, mainLayout):
         self.div1 = QFrame()
@@ -418,6 +802,24 @@ class UploadPage(QWidget):
         
         mainLayout.addLayout(sepearatorLayout)
 
+    def setupLotBasedPlaceholder(self, mainLayout):
+        """Reserve the lot-based extraction section, built on first use"""
+        self.lotSectionContainer = QWidget()
+        self.lotSectionLayout = QVBoxLayout(self.lotSectionContainer)
+        self.lotSectionLayout.setContentsMargins(0, 0, 0, 0)
+        
+        self.loadFromEbsButton = QPushButton("Load from EBS ▼")
+        self.loadFromEbsButton.setStyleSheet(_BTN_LINK_QSS)
+        self.loadFromEbsButton.clicked.connect(self.showLotBasedSection)
+        self.lotSectionLayout.addWidget(self.loadFromEbsButton)
+        
+        mainLayout.addWidget(self.lotSectionContainer)
+
+    def showLotBasedSection(self):
+        self.loadFromEbsButton.hide()
+        self.loadFromEbsButton.deleteLater()
+        self.setupLotBasedSection(self.lotSectionLayout)
+
     def setupLotBasedSection(self, mainLayout):
         lotNumbersSection = QVBoxLayout()
         lotHeaderLayout = QHBoxLayout()
@@ -425,29 +827,15 @@ class UploadPage(QWidget):
         lotLabel.setFont(QFont("Arial", 10, QFont.Bold))
         
         self.addBackendLotButton = QPushButton("Add Backend Lot")
-        self.addBackendLotButton.setIcon(QIcon(self.add_icon))
+        self.addBackendLotButton.setIcon(_cached_icon(self.add_icon))
         self.addBackendLotButton.setFixedSize(120, 30)
-        self.addBackendLotButton.setStyleSheet("""
-            QPushButton { 
-                border: none;
-                color: #1849D6;
-                text-align: left;
-                padding-left: 5px;
-            }
-        """)
+        self.addBackendLotButton.setStyleSheet(_BTN_LINK_QSS)
         self.addBackendLotButton.clicked.connect(lambda: self.add_lot_field(False))
 
         self.addFrontendLotButton = QPushButton("Add Frontend Lot")
-        self.addFrontendLotButton.setIcon(QIcon(self.add_icon))
+        self.addFrontendLotButton.setIcon(_cached_icon(self.add_icon))
         self.addFrontendLotButton.setFixedSize(120, 30)
-        self.addFrontendLotButton.setStyleSheet("""
-            QPushButton { 
-                border: none;
-                color: #1849D6;
-                text-align: left;
-                padding-left: 5px;
-            }
-        """)
+        self.addFrontendLotButton.setStyleSheet(_BTN_LINK_QSS)
         self.addFrontendLotButton.clicked.connect(lambda: self.add_lot_field(True))
 
         lotHeaderLayout.addWidget(lotLabel)
@@ -461,19 +849,7 @@ class UploadPage(QWidget):
         mainLayout.addLayout(lotNumbersSection)
 
         self.extractButton = QPushButton('Extract')
-        self.extractButton.setStyleSheet("""
-            QPushButton {
-                background-color: #1FBE42;
-                color: white;
-                border-radius: 5px;
-                padding: 5px 15px;
-                min-width: 40px;
-                margin-top: 20px;
-            }
-            QPushButton:disabled {
-                background-color: grey;
-            }
-        """)
+        self.extractButton.setStyleSheet(_BTN_EXTRACT_QSS)
         self.extractButton.setEnabled(False)
         self.extractButton.clicked.connect(self.start_extraction)
         mainLayout.addWidget(self.extractButton)
@@ -483,58 +859,54 @@ class UploadPage(QWidget):
         mainLayout.addWidget(self.statusArea)
 
     def setupFileListSection(self, mainLayout):
+        """Reserve the file list section, built when the first file is added"""
+        self.fileListContainer = QWidget()
+        self.fileListContainerLayout = QVBoxLayout(self.fileListContainer)
+        self.fileListContainerLayout.setContentsMargins(0, 0, 0, 0)
+        self.fileListView = None
+        
+        mainLayout.addWidget(self.fileListContainer)
+        mainLayout.addStretch()
+
+    def _ensure_file_list(self):
+        if self.fileListView is not None:
+            return
+        
         self.clearFilesButton = QPushButton("Clear All")
-        self.clearFilesButton.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #FF0000;
-                border: 1px solid #FF0000;
-                border-radius: 5px;
-                padding: 5px 15px;
-            }
-        """)
+        self.clearFilesButton.setStyleSheet(_BTN_CLEAR_QSS)
         self.clearFilesButton.clicked.connect(self.clearAllFiles)
-        mainLayout.addWidget(self.clearFilesButton)
+        self.fileListContainerLayout.addWidget(self.clearFilesButton)
         
-        self.fileListScrollArea = QScrollArea()
-        self.fileListScrollArea.setMinimumHeight(200)
-        self.fileListScrollArea.setWidgetResizable(True)
-        self.fileListScrollArea.setStyleSheet("QScrollArea { border: none; }")
+        # Rows are painted by a delegate, so only the visible ones cost anything
+        self.fileListView = QListView()
+        self.fileListView.setMinimumHeight(200)
+        self.fileListView.setFrameShape(QFrame.NoFrame)
+        self.fileListView.setStyleSheet(_FILE_LIST_VIEW_QSS)
+        self.fileListView.setSelectionMode(QListView.NoSelection)
+        self.fileListView.setUniformItemSizes(True)
+        self.fileListView.setModel(self.fileModel)
         
-        self.fileListContent = QWidget()
-        self.fileListLayout = QVBoxLayout(self.fileListContent)
-        self.fileListLayout.setAlignment(Qt.AlignTop)
-        self.fileListScrollArea.setWidget(self.fileListContent)
+        self.fileRowDelegate = FileRowDelegate(self._icon_cache, self.fileListView)
+        self.fileRowDelegate.deleteRequested.connect(self.removeFile, Qt.QueuedConnection)
+        self.fileListView.setItemDelegate(self.fileRowDelegate)
         
-        mainLayout.addWidget(self.fileListScrollArea)
-        mainLayout.addStretch()
-
-    def extract_zip_file(self, zip_path):
-        try:
-            extracted_files = []
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                for file_info in zip_ref.infolist():
-                    if file_info.filename.endswith(('.eff', '.tsf')):
-                        extract_path = os.path.join(self.temp_dir, os.path.basename(file_info.filename))
-                        with zip_ref.open(file_info) as source, open(extract_path, 'wb') as target:
-                            target.write(source.read())
-                        extracted_files.append(extract_path)
-            return extracted_files
-        except Exception as e:
-            QMessageBox.warning(self, "Extraction Error", f"Failed to extract {zip_path}: {str(e)}")
-            return []
+        self.fileListContainerLayout.addWidget(self.fileListView)
 
     def add_lot_field(self, is_frontend=False):
-        lot_input = LotInputWithInsertion(self.delete_icon, is_frontend)
-        lot_input.deleted.connect(self.remove_lot_field)
-        lot_input.input.textChanged.connect(self.validate_inputs)
-        if is_frontend:
-            lot_input.wafer_input.textChanged.connect(self.validate_inputs)
-        for insertion_input in lot_input.insertion_inputs:
-            insertion_input.textChanged.connect(self.validate_inputs)
-        self.lot_inputs.append(lot_input)
-        self.lotFieldsLayout.addWidget(lot_input)
-        self.update_delete_buttons()
+        container = self.lotSectionContainer
+        container.setUpdatesEnabled(False)
+        try:
+            lot_input = LotInputWithInsertion(self.delete_icon, is_frontend)
+            lot_input.deleted.connect(self.remove_lot_field)
+            lot_input.changed.connect(self._schedule_validation)
+            self.lot_inputs.append(lot_input)
+            self.lotFieldsLayout.addWidget(lot_input)
+            self.update_delete_buttons()
+        finally:
+            container.setUpdatesEnabled(True)
+        
+        # A new empty lot invalidates the form; validate once for the whole addition
+        self._schedule_validation()
 
     def remove_lot_field(self, lot_widget):
         if len(self.lot_inputs) > 0:
@@ -547,6 +919,9 @@ class UploadPage(QWidget):
         for i, lot_input in enumerate(self.lot_inputs):
             lot_input.deleteBtn.setVisible(len(self.lot_inputs) > 0)
 
+    def _schedule_validation(self, *_):
+        self._validate_timer.start()
+
     def validate_inputs(self):
         lots_valid = True
         has_insertions = False
@@ -568,6 +943,19 @@ class UploadPage(QWidget):
         self.extractButton.setEnabled(lots_valid and has_insertions and len(self.lot_inputs) > 0)
         
         if lots_valid and has_insertions:
+            # Only rescan when the set of requested chips actually changed
+            check_key = frozenset(
+                (lot_input.input.text().strip(), insertion,
+                 lot_input.wafer_input.text().strip() if lot_input.is_frontend else None)
+                for lot_input in self.lot_inputs
+                for insertion in lot_input.get_insertions()
+            )
+            if check_key == self._last_check_key:
+                return
+            self._last_check_key = check_key
+            
+            # One directory listing per (debounced) validation instead of a stat per chip
+            self._cache_dirty = True
             self.check_existing_files()
 
     def get_expected_filename(self, lot, insertion, wafer=None):
@@ -576,12 +964,20 @@ class UploadPage(QWidget):
         return f"{lot}_{insertion}.eff"
 
     def check_file_exists(self, lot, insertion, wafer=None):
-        expected_file = os.path.join(self.output_dir, self.get_expected_filename(lot, insertion, wafer))
-        return os.path.exists(expected_file)
+        if self._cache_dirty:
+            self._refresh_output_cache()
+        return self.get_expected_filename(lot, insertion, wafer) in self._output_files_cache
+
+    def _refresh_output_cache(self):
+        try:
+            with os.scandir(self.output_dir) as entries:
+                self._output_files_cache = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            self._output_files_cache = set()
+        self._cache_dirty = False
 
     def add_file_if_not_exists(self, file_path):
-        existing_paths = [path for path, _ in self.uploaded_files]
-        if file_path not in existing_paths and os.path.exists(file_path):
+        if not self.fileModel.contains(file_path) and os.path.exists(file_path):
             self.addFile(file_path)
             self.proceedButton.setEnabled(True)
 
@@ -601,6 +997,8 @@ class UploadPage(QWidget):
 
     def start_extraction(self):
         try:
+            # Take one fresh listing of the output directory for all chips below
+            self._refresh_output_cache()
             self.chips_to_process = []
             for lot_input in self.lot_inputs:
                 lot = lot_input.input.text().strip()
@@ -627,117 +1025,156 @@ class UploadPage(QWidget):
                 QMessageBox.information(self, "Information", "All files have already been extracted!")
                 return
 
-            self.current_extraction_index = 0
             self.statusArea.setText("Starting extraction...")
             self.extractButton.setEnabled(False)
-            self.process_next_chip()
+            for chip in self.chips_to_process:
+                self.start_chip_extraction(chip)
+            self.update_extraction_status()
 
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
             self.statusArea.setText("Extraction failed")
             self.extractButton.setEnabled(True)
 
-    def process_next_chip(self):
-        if self.current_extraction_index < len(self.chips_to_process):
-            current_lot, current_insertion, current_wafer, is_frontend = self.chips_to_process[self.current_extraction_index]
-            
-            extractor = self.extractors['frontend'] if is_frontend else self.extractors['backend']
-            
-            self.extraction_worker = ExtractionWorker(
-                current_lot,
-                [current_insertion],
-                extractor,
-                wafer=current_wafer,
-                max_workers=os.cpu_count()
-            )
-            
-            self.extraction_worker.finished.connect(self.extraction_completed)
-            self.extraction_worker.file_created.connect(
-                lambda f: self.add_extracted_file(f, current_lot, current_insertion, current_wafer)
-            )
-            self.extraction_worker.progress.connect(self.update_progress)
-            self.extraction_worker.start()
-
-            status_text = f"Processing lot {current_lot}"
-            if current_wafer:
-                status_text += f", wafer {current_wafer}"
-            status_text += f", insertion {current_insertion}..."
-            self.statusArea.setText(status_text)
-        else:
-            self.extractButton.setEnabled(True)
-            self.statusArea.setText("Extraction completed for all chips")
+    def start_chip_extraction(self, chip):
+        lot, insertion, wafer, is_frontend = chip
+        extractor = self.extractors['frontend'] if is_frontend else self.extractors['backend']
+        
+        worker = ExtractionWorker(
+            lot,
+            [insertion],
+            extractor,
+            wafer=wafer
+        )
+        self.extraction_workers.add(worker)
+        
+        signals = worker.signals
+        # Workers emit from pool threads, so always deliver on the GUI thread
+        signals.finished.connect(
+            lambda status, w=worker, c=chip: self._on_worker_done(w, c, status), Qt.QueuedConnection
+        )
+        signals.file_created.connect(self._queue_extracted_file, Qt.QueuedConnection)
+        signals.progress.connect(self.update_progress, Qt.QueuedConnection)
+        self._pending += 1
+        self.pool.start(worker)
+
+    def _on_worker_done(self, worker, chip, status_list):
+        self._pending -= 1
+        self.extraction_workers.discard(worker)
+        self.extraction_completed(chip, status_list)
 
-    def extraction_completed(self, status_list):
-        current_lot, current_insertion, current_wafer, _ = self.chips_to_process[self.current_extraction_index]
+    def extraction_completed(self, chip, status_list):
+        lot, insertion, wafer, _ = chip
         success = any(status[0].strip() == "Finished!" for status in status_list)
         
         if success:
             output_file = os.path.join(self.output_dir, 
-                                     self.get_expected_filename(current_lot, current_insertion, current_wafer))
+                                     self.get_expected_filename(lot, insertion, wafer))
             try:
-                self.add_extracted_file(output_file, current_lot, current_insertion, current_wafer)
+                self.add_extracted_file(output_file, lot, insertion, wafer)
             except Exception as e:
                 QMessageBox.warning(self, "Processing Warning", f"Error processing file: {str(e)}")
         
-        self.current_extraction_index += 1
-        if self.current_extraction_index < len(self.chips_to_process):
-            self.process_next_chip()
+        if self._pending > 0:
+            self.update_extraction_status()
         else:
             self.extractButton.setEnabled(True)
             self.statusArea.setText("All extractions completed")
             QMessageBox.information(self, "Extraction Complete", "All chips have been processed")
 
+    def update_extraction_status(self):
+        total = len(self.chips_to_process)
+        self.statusArea.setText(f"Extracting {total} chip(s): {total - self._pending} of {total} done...")
+
     def update_progress(self, filename, progress, real_filename, filesize):
-        if self.current_extraction_index < len(self.chips_to_process):
-            current_lot, current_insertion, current_wafer, _ = self.chips_to_process[self.current_extraction_index]
-            status_text = f"Processing lot {current_lot}"
-            if current_wafer:
-                status_text += f", wafer {current_wafer}"
-            status_text += f", insertion {current_insertion}: {progress}%"
-            self.statusArea.setText(status_text)
+        if self._pending > 0:
+            self.statusArea.setText(f"Processing {real_filename}: {progress}%")
+
+    def _queue_extracted_file(self, file_path, lot, insertion, wafer=None):
+        self._pending_files.append((file_path, lot, insertion, wafer))
+        self._flush_timer.start()
+
+    def _flush_pending(self):
+        pending, self._pending_files = self._pending_files, []
+        if not pending:
+            return
+        
+        self._ensure_file_list()
+        self.fileListView.setUpdatesEnabled(False)
+        try:
+            for file_path, lot, insertion, wafer in pending:
+                self.add_extracted_file(file_path, lot, insertion, wafer)
+        finally:
+            self.fileListView.setUpdatesEnabled(True)
 
     def add_extracted_file(self, file_path, lot, insertion, wafer=None):
-        if os.path.isfile(file_path):
+        try:
+            is_file = stat.S_ISREG(os.stat(file_path).st_mode)
+        except OSError:
+            is_file = False
+        
+        if is_file:
             new_filename = self.get_expected_filename(lot, insertion, wafer)
             new_path = os.path.join(self.output_dir, new_filename)
             
-            if any(new_path == path for path, _ in self.uploaded_files):
+            if self.fileModel.contains(new_path):
                 return
                 
-            if file_path != new_path:
+            try:
+                same_file = os.path.samefile(file_path, new_path)
+            except OSError:
+                same_file = False
+            
+            if not same_file:
                 try:
-                    os.rename(file_path, new_path)
+                    # os.replace overwrites an existing target on every platform
+                    os.replace(file_path, new_path)
+                    self._cache_dirty = True
                     self.addFile(new_path)
                 except Exception as e:
                     QMessageBox.warning(self, "File Error", f"Error renaming file: {str(e)}")
-                    if not any(file_path == path for path, _ in self.uploaded_files):
+                    if not self.fileModel.contains(file_path):
                         self.addFile(file_path)
             else:
-                if not any(file_path == path for path, _ in self.uploaded_files):
+                if not self.fileModel.contains(file_path):
                     self.addFile(file_path)
             
             self.proceedButton.setEnabled(True)
 
     def closeEvent(self, event):
         self.cleanup_workers()
+        self._temp_dir_ctx.cleanup()
         super().closeEvent(event)
     
     def cleanup_workers(self):
-        for worker in self.active_workers:
-            if worker.isRunning():
-                worker.stop()
-                worker.wait()
-        self.active_workers.clear()
+        # Drop queued extractions and let running ones finish
+        self.pool.clear()
+        self.pool.waitForDone()
+        self.extraction_workers.clear()
+        self._pending = 0
     
     def on_proceed_clicked(self):
-        all_files = []
-        for file_path, _ in self.uploaded_files:
-            if file_path.endswith('.zip'):
-                extracted = self.extract_zip_file(file_path)
-                all_files.extend(extracted)
-            else:
-                all_files.append(file_path)
+        paths = self.fileModel.paths()
+        if not any(_file_ext(path) == '.zip' for path in paths):
+            self.show_selection_signal.emit(paths)
+            return
         
+        # Extract archives off the GUI thread; the selection is emitted once all are done
+        self.proceedButton.setEnabled(False)
+        self.proceedButton.setText("Extracting... 0%")
+        self._zip_job = _ZipExtractJob(paths, self.temp_dir)
+        self._zip_job.signals.progress.connect(
+            lambda pct: self.proceedButton.setText(f"Extracting... {pct}%"), Qt.QueuedConnection
+        )
+        self._zip_job.signals.finished.connect(self._on_zips_extracted, Qt.QueuedConnection)
+        self.pool.start(self._zip_job)
+
+    def _on_zips_extracted(self, all_files, errors):
+        self._zip_job = None
+        self.proceedButton.setText("Proceed")
+        self.proceedButton.setEnabled(self.fileModel.rowCount() > 0)
+        for message in errors:
+            QMessageBox.warning(self, "Extraction Error", message)
         self.show_selection_signal.emit(all_files)
 
     def show_admin_login(self):
@@ -747,124 +1184,87 @@ class UploadPage(QWidget):
         if event.mimeData().hasUrls():
             urls = event.mimeData().urls()
             for url in urls:
-                file_path = url.toLocalFile()
-                if file_path.endswith(('.eff', '.tsf', '.zip')):
+                if _file_ext(url.toLocalFile()) in _ALLOWED_EXTS:
                     event.acceptProposedAction()
                     return
         event.ignore()
 
     def dropEvent(self, event: QDropEvent):
-        files_added = False
-        for url in event.mimeData().urls():
-            file_path = url.toLocalFile()
-            if file_path.endswith(('.eff', '.tsf', '.zip')):
-                existing_paths = [path for path, _ in self.uploaded_files]
-                if file_path not in existing_paths:
-                    self.addFile(file_path)
-                    files_added = True
-        
-        if files_added:
+        files = [
+            file_path for url in event.mimeData().urls()
+            if _file_ext(file_path := url.toLocalFile()) in _ALLOWED_EXTS
+        ]
+        if self.addFiles(files):
             self.proceedButton.setEnabled(True)
         event.acceptProposedAction()
 
-    def openFileDialog(self, event):
-        options = QFileDialog.Options()
-        files, _ = QFileDialog.getOpenFileNames(
-            self,
-            "Select Files",
-            "",
-            "EFF Files (*.eff);;TSF Files (*.tsf);;ZIP Files (*.zip)",
-            options=options
-        )
-        if files:
-            files_added = False
-            for file in files:
-                existing_paths = [path for path, _ in self.uploaded_files]
-                if file not in existing_paths:
-                    self.addFile(file)
-                    files_added = True
-            
-            if files_added:
-                self.proceedButton.setEnabled(True)
+    def openFileDialog(self):
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(
+                self,
+                "Select Files",
+                "",
+                "EFF Files (*.eff);;TSF Files (*.tsf);;ZIP Files (*.zip)"
+            )
+            self._file_dialog.setFileMode(QFileDialog.ExistingFiles)
+            # Skip per-entry icon and symlink lookups, which are slow on network shares
+            self._file_dialog.setOptions(QFileDialog.DontUseCustomDirectoryIcons | QFileDialog.DontResolveSymlinks)
+        
+        if not self._file_dialog.exec():
+            return
+        files = self._file_dialog.selectedFiles()
+        if files and self.addFiles(files):
+            self.proceedButton.setEnabled(True)
+
+    def addFiles(self, filePaths):
+        """Add several files to the list in one model insertion, returns True if any were added"""
+        rows = []
+        seen = set()
+        for filePath in filePaths:
+            if filePath in seen or self.fileModel.contains(filePath):
+                continue
+            try:
+                st = os.stat(filePath)
+            except OSError:
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            seen.add(filePath)
+            rows.append((filePath, os.path.basename(filePath), st.st_size / 1024.0))
+        
+        if not rows:
+            return False
+        self._ensure_file_list()
+        self.fileModel.add_files(rows)
+        return True
 
     def addFile(self, filePath):
-        if os.path.isfile(filePath):
-            existing_paths = [path for path, _ in self.uploaded_files]
-            if filePath in existing_paths:
-                return
-                
-            fileName = os.path.basename(filePath)
-            fileSize = os.path.getsize(filePath) / 1024.0
-            fileLayout = QHBoxLayout()
-            fileWidget = QWidget()
-            fileWidget.setStyleSheet("""
-                background-color: white;
-                border: 1px solid #E0E0E0;
-                border-radius: 5px;
-                max-height: 60px
-            """)
-            fileWidget.setLayout(fileLayout)
-            
-            fileIcon = QLabel()
-            iconPath = self.get_icon_path(filePath)
-            iconSize = 40
-            fileIcon.setPixmap(QPixmap(iconPath).scaled(
-                iconSize,
-                iconSize,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            ))
-            fileIcon.setStyleSheet("border: none;")
-
-            fileTitleLayout = QVBoxLayout()
-            fileTitle = QLabel(fileName)
-            fileTitle.setStyleSheet("color: black; border: none;")
-            fileSizeLabel = QLabel(f"{fileSize:.2f} KB")
-            fileSizeLabel.setStyleSheet("color: gray; font-size: 10px; border: none;")
-            
-            fileTitleLayout.addWidget(fileTitle)
-            fileTitleLayout.addWidget(fileSizeLabel)
-            
-            deleteButton = QPushButton()
-            deleteButton.setIcon(QPixmap(resource_path('./resources/icons/delete.png')).scaled(
-                20,
-                20,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            ))
-            deleteButton.setStyleSheet("border: none;")
-            deleteButton.clicked.connect(lambda: self.removeFile(filePath, fileWidget))
-            
-            fileLayout.addWidget(fileIcon)
-            fileLayout.addLayout(fileTitleLayout)
-            fileLayout.addStretch()
-            fileLayout.addWidget(deleteButton)
-            self.fileListLayout.addWidget(fileWidget)
-            self.uploaded_files.append((filePath, fileWidget))
-
-    def get_icon_path(self, filePath):
-        if filePath.endswith('.zip'):
-            return resource_path('./resources/icons/ZIP.png')
-        elif filePath.endswith('.eff'):
-            return resource_path('./resources/icons/EFF.png')
-        elif filePath.endswith('.tsf'):
-            return resource_path('./resources/icons/TSF.png')
-        return resource_path('./resources/icons/default.png')
-
-    def removeFile(self, filePath, fileWidget):
-        for path, widget in self.uploaded_files:
-            if path == filePath:
-                self.uploaded_files.remove((path, widget))
-                widget.setParent(None)
-                widget.deleteLater()
-                break
-        if not self.uploaded_files:
+        self.addFiles([filePath])
+
+    def _load_file_icons(self):
+        """Decode and scale the file-row icons once for reuse by every row"""
+        file_icon = QFileIconProvider().icon(QFileIconProvider.File)
+        trash_icon = self.style().standardIcon(QStyle.SP_TrashIcon)
+        
+        def scaled(name, size, fallback):
+            pixmap = _cached_pixmap(resource_path(f'./resources/icons/{name}'), size)
+            if pixmap.isNull():
+                # Use Qt's built-in icon when the bundled PNG is missing
+                return fallback.pixmap(size, size)
+            return pixmap
+        
+        icons = {ext: scaled(name, 40, file_icon) for ext, name in _EXT_TO_ICON.items()}
+        icons['default'] = scaled('default.png', 40, file_icon)
+        icons['delete'] = scaled('delete.png', 20, trash_icon)
+        return icons
+
+    def removeFile(self, filePath):
+        self.fileModel.remove_file(filePath)
+        self._last_check_key = None
+        if not self.fileModel.rowCount():
             self.proceedButton.setEnabled(False)
 
     def clearAllFiles(self):
-        while self.uploaded_files:
-            filePath, fileWidget = self.uploaded_files.pop()
-            fileWidget.setParent(None)
-            fileWidget.deleteLater()
+        self.fileModel.clear()
+        self._last_check_key = None
         self.proceedButton.setEnabled(False)
-        self.deleteBtn.set
\ No newline at end of file
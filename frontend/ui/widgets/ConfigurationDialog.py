@@ -3,6 +3,23 @@ from PySide6.QtWidgets import (QDialog, QVBoxLayout, QCheckBox,
                              QTableWidgetItem, QHeaderView)
 from PySide6.QtCore import Qt
 
+_CHECKBOX_QSS = """
+    QCheckBox {
+        border : none;
+        margin-bottom : 10px;
+        }
+    QCheckBox::indicator {
+        width: 15px;
+        height: 15px;
+        border: 1px solid #DADEE8;
+        border-radius: 5px;
+        background-color: white;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #1849D6;
+    }
+"""
+
 class ConfigurationDialog(QDialog):
     def __init__(self, columns, visible_columns, parent=None):
         super().__init__(parent)
@@ -20,6 +37,8 @@ class ConfigurationDialog(QDialog):
         scroll = QScrollArea()
         scroll_widget = QWidget()
         scroll_layout = QVBoxLayout(scroll_widget)
+        # Styled once on the container and inherited by every checkbox
+        scroll_widget.setStyleSheet(_CHECKBOX_QSS)
         
         self.checkboxes = {}
         self.default_columns = ["Test Name", "Test Number", "Product", "Status",
@@ -28,38 +47,16 @@ class ConfigurationDialog(QDialog):
         # Remove ACTION from visible_columns temporarily
         self.visible_columns = [col for col in visible_columns if col != "ACTION"]
         
-        # Filter out reference-related columns and ACTION
-        filtered_columns = [col for col in columns if not (
-            col.endswith('_reference') or 
-            col in ['input_data', 'reference_data', 'ACTION'] or
-            '_reference' in col
-        )]
-        
-        # Sort columns to put default ones first
-        sorted_columns = (
-            self.default_columns + 
-            [col for col in filtered_columns if col not in self.default_columns]
-        )
+        # Filter out reference-related columns and ACTION, putting default ones first
+        excluded = {'input_data', 'reference_data', 'ACTION', *self.default_columns}
+        sorted_columns = self.default_columns + [
+            col for col in columns
+            if col not in excluded and '_reference' not in col
+        ]
         
         # Create checkboxes
         for column in sorted_columns:
             checkbox = QCheckBox(column)
-            checkbox.setStyleSheet("""
-                QCheckBox {
-                    border : none;
-                    margin-bottom : 10px;
-                    }
-                QCheckBox::indicator {
-                    width: 15px;
-                    height: 15px;
-                    border: 1px solid #DADEE8;
-                    border-radius: 5px;
-                    background-color: white; 
-                }
-                QCheckBox::indicator:checked {
-                    background-color: #1849D6;
-                }
-            """)
             if column in self.default_columns:
                 checkbox.setChecked(True)
                 checkbox.setEnabled(False)
@@ -1,31 +1,60 @@
 from PySide6.QtWidgets import QWidget
-from PySide6.QtGui import QFont, QPainter, QPen, QBrush, QColor
+from PySide6.QtGui import QFont, QPainter, QPen, QBrush, QColor, QPixmap
 from PySide6.QtCore import Qt, QRectF
 
 class DonutProgress(QWidget):
+    RING_WIDTH = 25
+    
     def __init__(self, parent=None, percentage=0):
         super().__init__(parent)
         self._percentage = percentage
+        self._background = None
         self.setFixedSize(250, 250)
     
+    def resizeEvent(self, event):
+        self._background = None
+        super().resizeEvent(event)
+    
+    def _ring_rect(self):
+        # Centerline of the ring, so a pen of RING_WIDTH covers it edge to edge
+        margin = 10 + self.RING_WIDTH / 2
+        return QRectF(margin, margin, self.width() - 2 * margin, self.height() - 2 * margin)
+    
+    def _render_background(self):
+        """Render the static gray ring and white center once per widget size"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QBrush(QColor("white")))
+        painter.drawEllipse(QRectF(35, 35, self.width()-70, self.height()-70))
+        painter.setPen(QPen(QColor("#F2F2F2"), self.RING_WIDTH))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawEllipse(self._ring_rect())
+        painter.end()
+        return pixmap
+    
     def paintEvent(self, event):
+        if self._background is None:
+            self._background = self._render_background()
+        
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        # Draw the background circle (gray)
+        # Draw the cached background ring (gray) and inner circle
         rect = QRectF(10, 10, self.width()-20, self.height()-20)
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(QColor("#F2F2F2")))
-        painter.drawEllipse(rect)
-        
-        # Draw the progress arc (green)
-        painter.setBrush(QBrush(QColor("#22C55E")))  # Tailwind green-500
-        painter.drawPie(rect, 90 * 16, -self._percentage * 3.6 * 16)
+        painter.drawPixmap(0, 0, self._background)
         
-        # Draw the inner circle to create a donut shape
-        inner_rect = QRectF(35, 35, self.width()-70, self.height()-70)
-        painter.setBrush(QBrush(QColor("white")))
-        painter.drawEllipse(inner_rect)
+        # Draw the progress arc (green) as a single stroked arc over the ring
+        pen = QPen(QColor("#22C55E"), self.RING_WIDTH)  # Tailwind green-500
+        pen.setCapStyle(Qt.FlatCap)
+        painter.setPen(pen)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawArc(self._ring_rect(), 90 * 16, int(-self._percentage * 3.6 * 16))
         
         # Draw the percentage text in the center
         painter.setPen(QPen(QColor("#22C55E")))
@@ -33,5 +62,8 @@ class DonutProgress(QWidget):
         painter.drawText(rect, Qt.AlignCenter, f"{self._percentage}%")
     
     def setPercentage(self, value):
-        self._percentage = max(0, min(100, value))
+        value = max(0, min(100, value))
+        if value == self._percentage:
+            return
+        self._percentage = value
         self.update()
\ No newline at end of file
@@ -7,8 +7,8 @@ class EFFUploadDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Upload Reference Data")
         self.setModal(True)
-        self.setup_ui()
         self.file_path = None
+        self.setup_ui()
 
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -56,6 +56,9 @@ class EFFUploadDialog(QDialog):
         info_layout.addLayout(insertion_layout)
 
         layout.addWidget(info_frame)
+        
+        for edit in (self.product_edit, self.lot_edit, self.insertion_edit):
+            edit.textChanged.connect(self._check_can_upload)
 
         # Buttons
         button_layout = QHBoxLayout()
@@ -114,7 +117,7 @@ class EFFUploadDialog(QDialog):
             self.lot_edit.text().strip() and
             self.insertion_edit.text().strip()
         )
-        self.upload_btn.setEnabled(True)
+        self.upload_btn.setEnabled(bool(can_upload))
 
     def get_data(self):
         return {
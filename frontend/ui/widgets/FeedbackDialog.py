@@ -2,6 +2,7 @@ from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
                              QLabel, QComboBox, QCheckBox)
 from PySide6.QtCore import Qt
 from datetime import datetime
+import numpy as np
 class FeedbackDialog(QDialog):
     def __init__(self, current_status, test_name, test_number, lot, insertion, initial_label, 
                  reference_id, input_id, input_data=None, parent=None):
@@ -134,13 +135,12 @@ class FeedbackDialog(QDialog):
             # Prepare measurements data
             measurements = []
             if 'input_data' in self.input_data and isinstance(self.input_data['input_data'], list):
+                # None becomes NaN in the float array, so one mask drops missing and non-finite values
+                values = np.asarray(self.input_data['input_data'], dtype=np.float64)
+                chip_idx = np.flatnonzero(np.isfinite(values))
                 measurements = [
-                    {
-                        'chip_number': idx + 1,
-                        'value': float(value) if value is not None else None
-                    }
-                    for idx, value in enumerate(self.input_data['input_data'])
-                    if value is not None
+                    {'chip_number': idx + 1, 'value': value}
+                    for idx, value in zip(chip_idx.tolist(), values[chip_idx].tolist())
                 ]
             
             return {
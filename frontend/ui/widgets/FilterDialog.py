@@ -1,52 +1,126 @@
 from PySide6.QtWidgets import (QLabel, QVBoxLayout, QHBoxLayout, QLineEdit,
                              QDialogButtonBox, QDialog, QComboBox, QPushButton,
                              QScrollArea, QWidget, QFrame)
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QFont, QIcon
 from ui.utils.PathResources import resource_path
+
+# Condition rows are styled once from the filter container and matched by object name
+_CONDITION_QSS = """
+    QFrame#filterCondition {
+        border: 1px solid #e0e0e0;
+        border-radius: 8px;
+        background-color: #ffffff;
+        margin: 4px;
+        padding: 8px;
+    }
+    QFrame#filterCondition:hover {
+        border-color: #bdbdbd;
+        background-color: #fafafa;
+    }
+    QComboBox {
+        border: 1px solid #e0e0e0;
+        border-radius: 4px;
+        padding: 5px;
+        background-color: white;
+        min-height: 25px;
+    }
+    QComboBox:hover {
+        border-color: #1849D6;
+    }
+    QComboBox::drop-down {
+        border: none;
+        padding-right: 8px;
+    }
+    QLineEdit {
+        border: 1px solid #e0e0e0;
+        border-radius: 4px;
+        padding: 5px;
+        background-color: white;
+        min-height: 25px;
+    }
+    QLineEdit:focus {
+        border-color: #1849D6;
+    }
+    QPushButton#removeConditionButton {
+        border: none;
+        border-radius: 14px;
+        padding: 4px;
+        background-color: #f5f5f5;
+    }
+    QPushButton#removeConditionButton:hover {
+        background-color: #ffebee;
+    }
+"""
+
+_DIALOG_QSS = """
+    QDialog {
+        background-color: #fafafa;
+    }
+    QPushButton {
+        padding: 8px 20px;
+        border-radius: 6px;
+        font-weight: bold;
+    }
+    QLabel {
+        color: #333333;
+    }
+    QScrollArea {
+        background-color: transparent;
+    }
+    QWidget#filterContainer {
+        background-color: transparent;
+    }
+"""
+
+_ADD_BUTTON_QSS = """
+    QPushButton {
+        background-color: #1849D6;
+        color: white;
+        font-size: 13px;
+    }
+    QPushButton:hover {
+        background-color: #2859E6;
+    }
+"""
+
+_APPLY_BUTTON_QSS = """
+    QPushButton {
+        background-color: #1FBE42;
+        color: white;
+        min-width: 120px;
+    }
+    QPushButton:hover {
+        background-color: #2FCE52;
+    }
+"""
+
+_CANCEL_BUTTON_QSS = """
+    QPushButton {
+        background-color: #f5f5f5;
+        color: #333333;
+        min-width: 100px;
+    }
+    QPushButton:hover {
+        background-color: #e0e0e0;
+    }
+"""
+
 class FilterCondition(QFrame):
     removed = Signal(object)
+    _remove_icon = None
+    
+    @classmethod
+    def remove_icon(cls):
+        """Load the remove icon on first use (a QApplication must exist) and share it"""
+        if cls._remove_icon is None:
+            cls._remove_icon = QIcon(resource_path('./resources/icons/remove.png'))
+        return cls._remove_icon
     
     def __init__(self, columns, parent=None):
         super().__init__(parent)
         self.setFrameStyle(QFrame.Box | QFrame.Raised)
-        self.setStyleSheet("""
-            QFrame {
-                border: 1px solid #e0e0e0;
-                border-radius: 8px;
-                background-color: #ffffff;
-                margin: 4px;
-                padding: 8px;
-            }
-            QFrame:hover {
-                border-color: #bdbdbd;
-                background-color: #fafafa;
-            }
-            QComboBox {
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-                padding: 5px;
-                background-color: white;
-                min-height: 25px;
-            }
-            QComboBox:hover {
-                border-color: #1849D6;
-            }
-            QComboBox::drop-down {
-                border: none;
-                padding-right: 8px;
-            }
-            QLineEdit {
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-                padding: 5px;
-                background-color: white;
-                min-height: 25px;
-            }
-            QLineEdit:focus {
-                border-color: #1849D6;
-            }
-        """)
+        self.setObjectName("filterCondition")
         
         layout = QHBoxLayout(self)
         layout.setSpacing(10)
@@ -65,19 +139,9 @@ class FilterCondition(QFrame):
         self.valueEdit.setMinimumWidth(200)
         
         self.removeButton = QPushButton()
-        self.removeButton.setIcon(QIcon(resource_path('./resources/icons/remove.png')))
+        self.removeButton.setIcon(self.remove_icon())
         self.removeButton.setFixedSize(28, 28)
-        self.removeButton.setStyleSheet("""
-            QPushButton {
-                border: none;
-                border-radius: 14px;
-                padding: 4px;
-                background-color: #f5f5f5;
-            }
-            QPushButton:hover {
-                background-color: #ffebee;
-            }
-        """)
+        self.removeButton.setObjectName("removeConditionButton")
         self.removeButton.clicked.connect(lambda: self.removed.emit(self))
         
         layout.addWidget(self.columnCombo)
@@ -107,25 +171,7 @@ class FilterDialog(QDialog):
                 if header_item:
                     self.columns.append(header_item.text())
         
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #fafafa;
-            }
-            QPushButton {
-                padding: 8px 20px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QLabel {
-                color: #333333;
-            }
-            QScrollArea {
-                background-color: transparent;
-            }
-            QWidget#filterContainer {
-                background-color: transparent;
-            }
-        """)
+        self.setStyleSheet(_DIALOG_QSS)
         
         mainLayout = QVBoxLayout(self)
         mainLayout.setSpacing(15)
@@ -134,10 +180,11 @@ class FilterDialog(QDialog):
         headerLayout.addStretch()
         scrollArea = QScrollArea()
         scrollArea.setWidgetResizable(True)
-        scrollArea.setStyleSheet("QScrollArea { border: none; }")
+        scrollArea.setFrameShape(QFrame.NoFrame)
         
         self.filterContainer = QWidget()
         self.filterContainer.setObjectName("filterContainer")
+        self.filterContainer.setStyleSheet(_CONDITION_QSS)
         self.filterLayout = QVBoxLayout(self.filterContainer)
         self.filterLayout.setSpacing(8)
         scrollArea.setWidget(self.filterContainer)
@@ -146,16 +193,7 @@ class FilterDialog(QDialog):
         self.add_condition()
         
         addButton = QPushButton("Add Another Filter")
-        addButton.setStyleSheet("""
-            QPushButton {
-                background-color: #1849D6;
-                color: white;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #2859E6;
-            }
-        """)
+        addButton.setStyleSheet(_ADD_BUTTON_QSS)
         addButton.clicked.connect(self.add_condition)
         
         buttonBox = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
@@ -163,27 +201,9 @@ class FilterDialog(QDialog):
         cancelButton = buttonBox.button(QDialogButtonBox.Cancel)
         
         applyButton.setText("Apply Filters")
-        applyButton.setStyleSheet("""
-            QPushButton {
-                background-color: #1FBE42;
-                color: white;
-                min-width: 120px;
-            }
-            QPushButton:hover {
-                background-color: #2FCE52;
-            }
-        """)
+        applyButton.setStyleSheet(_APPLY_BUTTON_QSS)
         
-        cancelButton.setStyleSheet("""
-            QPushButton {
-                background-color: #f5f5f5;
-                color: #333333;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-        """)
+        cancelButton.setStyleSheet(_CANCEL_BUTTON_QSS)
         
         buttonBox.accepted.connect(self.accept)
         buttonBox.rejected.connect(self.reject)
@@ -202,135 +222,160 @@ class FilterDialog(QDialog):
 
     def remove_condition(self, condition):
         if len(self.conditions) > 1:
+            # Coalesce removals made in the same event loop pass into one relayout
+            if self.filterContainer.updatesEnabled():
+                self.filterContainer.setUpdatesEnabled(False)
+                QTimer.singleShot(0, lambda: self.filterContainer.setUpdatesEnabled(True))
             self.conditions.remove(condition)
+            self.filterLayout.removeWidget(condition)
             condition.deleteLater()
 
     def get_filter_values(self):
         return [condition.get_filter_values() for condition in self.conditions]
 
+# Cell texts treated as missing values, including the empty string
+_NAN_TOKENS = frozenset({'', 'nan', 'null', 'none', 'n/a', '#n/a', '#null!', '#div/0!'})
+
+def _is_nan_value(value):
+    """Check if a value represents NaN/null/empty"""
+    return not value or value.strip().lower() in _NAN_TOKENS
+
+def _to_number(value):
+    """Parse a value as a number, returning None for NaN or non-numeric text"""
+    if _is_nan_value(value):
+        return None
+    try:
+        num = float(value.strip())
+    except (ValueError, TypeError):
+        return None
+    return None if num != num else num  # Check for float('nan')
+
 def apply_filter(table, filter_conditions):
-    def is_nan_value(value):
-        """Check if a value represents NaN/null/empty"""
-        if not value or value.strip() == '':
-            return True
-        value_lower = value.strip().lower()
-        return value_lower in ['nan', 'null', 'none', 'n/a', '#n/a', '#null!', '#div/0!']
+    def text_condition(test):
+        def build(filter_value, filter_lower, filter_num):
+            # NaN values don't contain/start with/end with anything meaningful
+            return lambda cell, cell_lower, cell_num: not _is_nan_value(cell_lower) and test(cell_lower, filter_lower)
+        return build
     
-    def is_numeric_value(value):
-        """Check if a value can be converted to a number and is not NaN"""
-        if is_nan_value(value):
-            return False
-        try:
-            num = float(value.strip())
-            return not (num != num)  # Check for float('nan')
-        except (ValueError, TypeError):
-            return False
+    def equality_condition(want_equal):
+        def build(filter_value, filter_lower, filter_num):
+            # NaN values only equal an explicit NaN filter value
+            filter_is_nan = _is_nan_value(filter_value)
+            return lambda cell, cell_lower, cell_num: (
+                filter_is_nan if _is_nan_value(cell_lower) else filter_lower == cell_lower
+            ) == want_equal
+        return build
     
-    for row in range(table.rowCount()):
-        should_show = True
-        
-        if not filter_conditions:
-            table.setRowHidden(row, False)
+    def numeric_condition(compare):
+        def build(filter_value, filter_lower, filter_num):
+            def predicate(cell, cell_lower, cell_num):
+                # NaN and non-numeric values are excluded from numeric comparisons
+                if cell_num is None:
+                    return False
+                if filter_num is not None:
+                    return compare(cell_num, filter_num)
+                return compare(cell, filter_value)
+            return predicate
+        return build
+    
+    condition_builders = {
+        'contains': text_condition(str.__contains__),
+        'starts with': text_condition(str.startswith),
+        'ends with': text_condition(str.endswith),
+        'equals': equality_condition(True),
+        'not equals': equality_condition(False),
+        'greater than': numeric_condition(lambda a, b: a > b),
+        'less than': numeric_condition(lambda a, b: a < b),
+    }
+    # Lowercased text and parsed numbers are computed once per row and column, only when used
+    lowered_operators = {'contains', 'starts with', 'ends with', 'equals', 'not equals'}
+    numeric_operators = {'greater than', 'less than'}
+    # Cheaper tests run first so a failing row is rejected as early as possible
+    operator_costs = {'equals': 0, 'not equals': 0, 'starts with': 1, 'ends with': 1,
+                      'greater than': 1, 'less than': 1, 'contains': 2}
+    # Unknown operators only require the cell to exist
+    any_value = lambda filter_value, filter_lower, filter_num: lambda cell, cell_lower, cell_num: True
+    
+    # Resolve header names and compile each condition once, not per row
+    column_indexes = {}
+    for i in range(table.columnCount()):
+        header_item = table.horizontalHeaderItem(i)
+        if header_item:
+            column_indexes.setdefault(header_item.text(), i)
+    
+    # Group conditions by column so each cell is read and converted once per row
+    columns = {}
+    for condition in filter_conditions:
+        filter_value = condition['value']
+        if not filter_value:
             continue
+        column_index = column_indexes.get(condition['column'])
+        if column_index is None:
+            continue
+        operator = condition['operator']
+        build = condition_builders.get(operator, any_value)
+        filter_value = filter_value.strip()
+        predicate = build(filter_value, filter_value.lower(), _to_number(filter_value))
+        columns.setdefault(column_index, []).append((operator_costs.get(operator, 0), operator, predicate))
+    
+    compiled = []
+    for column_index, entries in columns.items():
+        entries.sort(key=lambda entry: entry[0])
+        operators = {operator for _, operator, _ in entries}
+        compiled.append((
+            entries[0][0],
+            column_index,
+            not operators.isdisjoint(lowered_operators),
+            not operators.isdisjoint(numeric_operators),
+            [predicate for _, _, predicate in entries],
+        ))
+    compiled.sort(key=lambda group: group[0])
+    
+    # Bind the Qt calls made per row to locals
+    row_count = table.rowCount()
+    get_item = table.item
+    is_hidden = table.isRowHidden
+    set_hidden = table.setRowHidden
+    
+    # Hide and show rows with repaints suspended so the view redraws once
+    table.setUpdatesEnabled(False)
+    try:
+        if not compiled:
+            # No usable condition: every row is shown, no cells need reading
+            for row in range(row_count):
+                if is_hidden(row):
+                    set_hidden(row, False)
+            return
+        
+        # Read each referenced column out of the table once; None marks a missing item
+        col_strs = {}
+        for _, column_index, _, _, _ in compiled:
+            items = (get_item(row, column_index) for row in range(row_count))
+            col_strs[column_index] = [item.text().strip() if item else None for item in items]
+        
+        for row in range(row_count):
+            should_show = True
             
-        for condition in filter_conditions:
-            column_name = condition['column']
-            operator = condition['operator']
-            filter_value = condition['value']
-            
-            if not filter_value:
-                continue
-                
-            column_index = -1
-            for i in range(table.columnCount()):
-                header_item = table.horizontalHeaderItem(i)
-                if header_item and header_item.text() == column_name:
-                    column_index = i
-                    break
-            
-            if column_index == -1:
-                continue
-                
-            item = table.item(row, column_index)
-            if not item:
-                should_show = False
-                break
-                
-            cell_value = item.text().strip()
-            filter_value = filter_value.strip()
-            
-            # Handle NaN values - exclude them from numeric comparisons
-            if is_nan_value(cell_value):
-                if operator in ['greater than', 'less than']:
+            for _, column_index, needs_lower, needs_number, predicates in compiled:
+                cell = col_strs[column_index][row]
+                if cell is None:
                     should_show = False
                     break
-                elif operator == 'equals':
-                    # Only show NaN values if explicitly filtering for them
-                    if not is_nan_value(filter_value):
-                        should_show = False
-                        break
-                elif operator == 'not equals':
-                    # NaN values should be shown only if not filtering for NaN
-                    if is_nan_value(filter_value):
+                
+                cell_lower = cell.lower() if needs_lower else None
+                cell_num = _to_number(cell) if needs_number else None
+                try:
+                    if not all(predicate(cell, cell_lower, cell_num) for predicate in predicates):
                         should_show = False
                         break
-                elif operator in ['contains', 'starts with', 'ends with']:
-                    # NaN values don't contain/start with/end with anything meaningful
+                except Exception as e:
+                    print(f"Error applying filter: {str(e)}")
+                    # On error, hide the row to be safe
                     should_show = False
                     break
-                continue
             
-            try:
-                if operator == 'contains':
-                    if filter_value.lower() not in cell_value.lower():
-                        should_show = False
-                        break
-                elif operator == 'equals':
-                    if filter_value.lower() != cell_value.lower():
-                        should_show = False
-                        break
-                elif operator == 'starts with':
-                    if not cell_value.lower().startswith(filter_value.lower()):
-                        should_show = False
-                        break
-                elif operator == 'ends with':
-                    if not cell_value.lower().endswith(filter_value.lower()):
-                        should_show = False
-                        break
-                elif operator == 'greater than':
-                    if is_numeric_value(cell_value) and is_numeric_value(filter_value):
-                        if float(cell_value) <= float(filter_value):
-                            should_show = False
-                            break
-                    else:
-                        # For non-numeric comparisons, exclude if cell_value is not numeric
-                        if not is_numeric_value(cell_value):
-                            should_show = False
-                            break
-                        elif cell_value <= filter_value:
-                            should_show = False
-                            break
-                elif operator == 'less than':
-                    if is_numeric_value(cell_value) and is_numeric_value(filter_value):
-                        if float(cell_value) >= float(filter_value):
-                            should_show = False
-                            break
-                    else:
-                        # For non-numeric comparisons, exclude if cell_value is not numeric
-                        if not is_numeric_value(cell_value):
-                            should_show = False
-                            break
-                        elif cell_value >= filter_value:
-                            should_show = False
-                            break
-                elif operator == 'not equals':
-                    if filter_value.lower() == cell_value.lower():
-                        should_show = False
-                        break
-            except Exception as e:
-                print(f"Error applying filter: {str(e)}")
-                # On error, hide the row to be safe
-                should_show = False
-                break
-        
-        table.setRowHidden(row, not should_show)
\ No newline at end of file
+            # Only touch rows whose visibility actually changes
+            if is_hidden(row) == should_show:
+                set_hidden(row, not should_show)
+    finally:
+        table.setUpdatesEnabled(True)
\ No newline at end of file
@@ -1,8 +1,95 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QFrame, QSizePolicy)
-from PySide6.QtCore import Qt, QRectF, QPropertyAnimation, QEasingCurve, Property
+from PySide6.QtCore import Qt, QRectF, QLineF, QObject, QTimer, Property
 from PySide6.QtGui import (QFont, QPainter, QColor, QPen, QFontDatabase, 
-                          QLinearGradient, QRadialGradient, QPainterPath)
+                          QLinearGradient, QRadialGradient, QPainterPath, QPixmap, QGuiApplication)
 import math
+import time
+import weakref
+
+# Arc colors, shared so a color change can be detected by identity
+_GOOD_COLOR = QColor("#10B981")
+_MODERATE_COLOR = QColor("#F59E0B")
+_BAD_COLOR = QColor("#EF4444")
+_TEXT_COLOR = QColor("#333333")
+_CENTER_COLOR = QColor("#ffffff")
+
+# Unit directions of the tick marks, one every 30 degrees around the full circle
+_TICK_DIRECTIONS = [(math.cos(math.radians(i)), math.sin(math.radians(i))) for i in range(0, 360, 30)]
+
+def _tick_lines(rect):
+    """Tick mark segments for a gauge drawn in rect"""
+    center = rect.center()
+    outer_radius = rect.width() * 0.48
+    inner_radius = rect.width() * 0.45
+    return [
+        QLineF(center.x() + outer_radius * cos_angle, center.y() - outer_radius * sin_angle,
+               center.x() + inner_radius * cos_angle, center.y() - inner_radius * sin_angle)
+        for cos_angle, sin_angle in _TICK_DIRECTIONS
+    ]
+
+def _arc_pen(rect, color):
+    """Round-capped gradient pen for a value arc drawn in rect"""
+    gradient = QLinearGradient(rect.topLeft(), rect.bottomRight())
+    gradient.setColorAt(0, color.lighter(120))
+    gradient.setColorAt(1, color)
+    
+    pen = QPen()
+    pen.setBrush(gradient)
+    pen.setWidth(int(rect.width() * 0.1))
+    pen.setCapStyle(Qt.RoundCap)
+    return pen
+
+def _frame_interval():
+    """Seconds between refreshes of the primary screen"""
+    screen = QGuiApplication.primaryScreen()
+    refresh_rate = screen.refreshRate() if screen else 0
+    return 1 / refresh_rate if refresh_rate > 0 else 1 / 60
+
+_ANIMATION_DURATION = 1.0  # seconds
+
+class _AnimationHub(QObject):
+    """Advances every running gauge animation from a single display-rate timer"""
+    def __init__(self):
+        super().__init__()
+        # gauge -> (start time, start value, end value)
+        self._animations = weakref.WeakKeyDictionary()
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(max(1, round(_frame_interval() * 1000)))
+        self._timer.timeout.connect(self.tick)
+
+    def animate(self, gauge, start_value, end_value):
+        self._animations[gauge] = (time.monotonic(), start_value, end_value)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def tick(self):
+        now = time.monotonic()
+        for gauge, (start_time, start_value, end_value) in list(self._animations.items()):
+            t = min(1.0, (now - start_time) / _ANIMATION_DURATION)
+            eased = 1 - (1 - t) ** 3  # OutCubic
+            try:
+                gauge.set_value(start_value + (end_value - start_value) * eased)
+                if t >= 1:
+                    # Always paint the terminal frame, even if its step was coalesced
+                    gauge.update()
+            except RuntimeError:
+                # The gauge was deleted on the C++ side while still animating
+                t = 1
+            if t >= 1:
+                del self._animations[gauge]
+        
+        if not self._animations:
+            self._timer.stop()
+
+# Shared hub, created with the first gauge
+_animation_hub = None
+
+def _get_animation_hub():
+    global _animation_hub
+    if _animation_hub is None:
+        _animation_hub = _AnimationHub()
+    return _animation_hub
 
 class GaugeWidget(QWidget):
     def __init__(self, value, threshold):
@@ -10,40 +97,86 @@ class GaugeWidget(QWidget):
         self._value = 0  # Start from 0 for animation
         self.target_value = value
         self.threshold = threshold
+        self._background = None
+        self._tick_lines = None
+        self._tick_pen = QPen(QColor("#cccccc"), 2)
+        self._frame_interval = _frame_interval()
+        self._last_paint_time = 0.0
+        self._last_painted_value = None
+        self._arc_color = None
+        self._arc_pen = None
+        self._font_size = -1
+        self._font = None
         self.setup_ui()
         self.setup_animation()
         
     def setup_ui(self):
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.setMinimumSize(200, 200)
+        # The cached background covers the gauge; the shadow still needs the parent behind it
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
         
     def setup_animation(self):
-        self.animation = QPropertyAnimation(self, b"value")
-        self.animation.setDuration(1000)
-        self.animation.setEasingCurve(QEasingCurve.OutCubic)
-        self.animation.setStartValue(0)
-        self.animation.setEndValue(self.target_value)
-        self.animation.start()
+        self.animate_to(self.target_value)
+
+    def animate_to(self, value):
+        """Animate the gauge from its current value to value"""
+        self.target_value = value
+        _get_animation_hub().animate(self, self._value, value)
 
     def get_value(self):
         return self._value
 
     def set_value(self, value):
         self._value = value
+        # Skip repaints faster than the display unless the value moved visibly
+        now = time.monotonic()
+        if (self._last_painted_value is not None
+                and now - self._last_paint_time < self._frame_interval
+                and abs(value - self._last_painted_value) < 0.5):
+            return
+        self._last_paint_time = now
+        self._last_painted_value = value
         self.update()
 
     value = Property(float, get_value, set_value)
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+    def resizeEvent(self, event):
+        self._background = None
+        self._tick_lines = None
+        self._arc_pen = None
+        super().resizeEvent(event)
 
+    def gauge_rect(self):
         # Calculate dimensions based on widget size
         side = min(self.width(), self.height())
         margin = side * 0.1
-        rect = QRectF(margin, margin, side - 2*margin, side - 2*margin)
+        return QRectF(margin, margin, side - 2*margin, side - 2*margin)
+
+    def render_background(self, rect):
+        """Render the shadow, track ring and center circle once per widget size"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
         
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
         self.draw_background(painter, rect)
+        self.draw_center(painter, rect)
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        rect = self.gauge_rect()
+        if self._background is None:
+            self._background = self.render_background(rect)
+        
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        # Only the arc, value text and tick marks change between frames
+        painter.drawPixmap(0, 0, self._background)
         self.draw_gauge(painter, rect)
         self.draw_value(painter, rect)
         self.draw_decorations(painter, rect)
@@ -62,40 +195,42 @@ class GaugeWidget(QWidget):
         painter.drawArc(rect, 0, 360 * 16)  # Full circle background
 
     def draw_gauge(self, painter, rect):
-        # Draw value arc with gradient
+        # Draw value arc with gradient, rebuilt only when the arc color changes
         color = self.get_arc_color(self.value)
-        gradient = QLinearGradient(rect.topLeft(), rect.bottomRight())
-        gradient.setColorAt(0, color.lighter(120))
-        gradient.setColorAt(1, color)
-        
-        pen = QPen()
-        pen.setBrush(gradient)
-        pen.setWidth(int(rect.width() * 0.1))
-        pen.setCapStyle(Qt.RoundCap)
-        painter.setPen(pen)
+        if self._arc_pen is None or color is not self._arc_color:
+            self._arc_color = color
+            self._arc_pen = _arc_pen(rect, color)
+        painter.setPen(self._arc_pen)
         
         # Draw full circle progress
         span_angle = (self.value * 360 / 100) * 16  # Full circle progress
         painter.drawArc(rect, 90 * 16, -span_angle)  # Start from top (90 degrees)
 
-    def draw_value(self, painter, rect):
-        # Draw center circle
+    def center_rect(self, rect):
         center_radius = rect.width() * 0.3
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor("#ffffff"))
-        center_rect = QRectF(
+        return QRectF(
             rect.center().x() - center_radius,
             rect.center().y() - center_radius,
             center_radius * 2,
             center_radius * 2
         )
-        painter.drawEllipse(center_rect)
+
+    def draw_center(self, painter, rect):
+        # Draw center circle
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(_CENTER_COLOR)
+        painter.drawEllipse(self.center_rect(rect))
+
+    def draw_value(self, painter, rect):
+        center_rect = self.center_rect(rect)
         
         # Draw value text
         font_size = int(rect.width() * 0.2)
-        font = QFont("Arial", font_size, QFont.Bold)
-        painter.setFont(font)
-        painter.setPen(QColor("#333333"))
+        if font_size != self._font_size:
+            self._font_size = font_size
+            self._font = QFont("Arial", font_size, QFont.Bold)
+        painter.setFont(self._font)
+        painter.setPen(_TEXT_COLOR)
         
         # Draw percentage
         text = f"{int(self.value)}%"
@@ -103,31 +238,19 @@ class GaugeWidget(QWidget):
         painter.drawText(text_rect, Qt.AlignCenter, text)
 
     def draw_decorations(self, painter, rect):
-        # Draw tick marks around the full circle
-        painter.setPen(QPen(QColor("#cccccc"), 2))
-        center = rect.center()
-        outer_radius = rect.width() * 0.48
-        inner_radius = rect.width() * 0.45
-        
-        for i in range(0, 360, 30):  # Draw marks every 30 degrees around full circle
-            angle = math.radians(i)
-            cos_angle = math.cos(angle)
-            sin_angle = math.sin(angle)
-            
-            start_x = center.x() + outer_radius * cos_angle
-            start_y = center.y() - outer_radius * sin_angle
-            end_x = center.x() + inner_radius * cos_angle
-            end_y = center.y() - inner_radius * sin_angle
-            
-            painter.drawLine(start_x, start_y, end_x, end_y)
+        # Draw tick marks around the full circle, computed once per widget size
+        if self._tick_lines is None:
+            self._tick_lines = _tick_lines(rect)
+        painter.setPen(self._tick_pen)
+        painter.drawLines(self._tick_lines)
 
     def get_arc_color(self, value):
         if value >= self.threshold["good"]:
-            return QColor("#10B981")
+            return _GOOD_COLOR
         elif value >= self.threshold["moderate"]:
-            return QColor("#F59E0B")
+            return _MODERATE_COLOR
         else:
-            return QColor("#EF4444")
+            return _BAD_COLOR
 
 class MetricWidget(QFrame):
     def __init__(self, title, value, threshold):
@@ -164,39 +287,84 @@ class FeedbackGaugeWidget(QWidget):
         self._value = 0
         self.target_value = value
         self.max_value = max_value
+        self._background = None
+        self._tick_lines = None
+        self._tick_pen = QPen(QColor("#cccccc"), 2)
+        self._frame_interval = _frame_interval()
+        self._last_paint_time = 0.0
+        self._last_painted_value = None
+        self._arc_color = None
+        self._arc_pen = None
+        self._font_size = -1
+        self._font = None
         self.setup_ui()
         self.setup_animation()
 
     def setup_ui(self):
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.setMinimumSize(200, 200)
+        # The cached background covers the gauge; the shadow still needs the parent behind it
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
 
     def setup_animation(self):
-        self.animation = QPropertyAnimation(self, b"value")
-        self.animation.setDuration(1000)
-        self.animation.setEasingCurve(QEasingCurve.OutCubic)
-        self.animation.setStartValue(0)
-        self.animation.setEndValue(self.target_value)
-        self.animation.start()
+        self.animate_to(self.target_value)
+
+    def animate_to(self, value):
+        """Animate the gauge from its current value to value"""
+        self.target_value = value
+        _get_animation_hub().animate(self, self._value, value)
 
     def get_value(self):
         return self._value
 
     def set_value(self, value):
         self._value = value
+        # Skip repaints faster than the display unless the value moved visibly
+        now = time.monotonic()
+        if (self._last_painted_value is not None
+                and now - self._last_paint_time < self._frame_interval
+                and abs(value - self._last_painted_value) < 0.5):
+            return
+        self._last_paint_time = now
+        self._last_painted_value = value
         self.update()
 
     value = Property(float, get_value, set_value)
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+    def resizeEvent(self, event):
+        self._background = None
+        self._tick_lines = None
+        self._arc_pen = None
+        super().resizeEvent(event)
 
+    def gauge_rect(self):
         side = min(self.width(), self.height())
         margin = side * 0.1
-        rect = QRectF(margin, margin, side - 2*margin, side - 2*margin)
+        return QRectF(margin, margin, side - 2*margin, side - 2*margin)
+
+    def render_background(self, rect):
+        """Render the shadow, track ring and center circle once per widget size"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
 
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
         self.draw_background(painter, rect)
+        self.draw_center(painter, rect)
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        rect = self.gauge_rect()
+        if self._background is None:
+            self._background = self.render_background(rect)
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        painter.drawPixmap(0, 0, self._background)
         self.draw_gauge(painter, rect)
         self.draw_value(painter, rect)
         self.draw_decorations(painter, rect)
@@ -215,66 +383,55 @@ class FeedbackGaugeWidget(QWidget):
     def draw_gauge(self, painter, rect):
         percentage = min(100, (self.value / self.max_value) * 100)
         color = self.get_feedback_color(percentage)
-        
-        gradient = QLinearGradient(rect.topLeft(), rect.bottomRight())
-        gradient.setColorAt(0, color.lighter(120))
-        gradient.setColorAt(1, color)
-        
-        pen = QPen()
-        pen.setBrush(gradient)
-        pen.setWidth(int(rect.width() * 0.1))
-        pen.setCapStyle(Qt.RoundCap)
-        painter.setPen(pen)
+        if self._arc_pen is None or color is not self._arc_color:
+            self._arc_color = color
+            self._arc_pen = _arc_pen(rect, color)
+        painter.setPen(self._arc_pen)
         
         span_angle = (percentage * 360 / 100) * 16  # Full circle progress
         painter.drawArc(rect, 90 * 16, -span_angle)  # Start from top
 
-    def draw_value(self, painter, rect):
+    def center_rect(self, rect):
         center_radius = rect.width() * 0.3
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor("#ffffff"))
-        center_rect = QRectF(
+        return QRectF(
             rect.center().x() - center_radius,
             rect.center().y() - center_radius,
             center_radius * 2,
             center_radius * 2
         )
-        painter.drawEllipse(center_rect)
+
+    def draw_center(self, painter, rect):
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(_CENTER_COLOR)
+        painter.drawEllipse(self.center_rect(rect))
+
+    def draw_value(self, painter, rect):
+        center_rect = self.center_rect(rect)
         
         font_size = int(rect.width() * 0.2)
-        font = QFont("Arial", font_size, QFont.Bold)
-        painter.setFont(font)
-        painter.setPen(QColor("#333333"))
+        if font_size != self._font_size:
+            self._font_size = font_size
+            self._font = QFont("Arial", font_size, QFont.Bold)
+        painter.setFont(self._font)
+        painter.setPen(_TEXT_COLOR)
         
         text = str(int(self.value))
         text_rect = QRectF(center_rect)
         painter.drawText(text_rect, Qt.AlignCenter, text)
 
     def draw_decorations(self, painter, rect):
-        painter.setPen(QPen(QColor("#cccccc"), 2))
-        center = rect.center()
-        outer_radius = rect.width() * 0.48
-        inner_radius = rect.width() * 0.45
-        
-        for i in range(0, 360, 30):  # Full circle tick marks
-            angle = math.radians(i)
-            cos_angle = math.cos(angle)
-            sin_angle = math.sin(angle)
-            
-            start_x = center.x() + outer_radius * cos_angle
-            start_y = center.y() - outer_radius * sin_angle
-            end_x = center.x() + inner_radius * cos_angle
-            end_y = center.y() - inner_radius * sin_angle
-            
-            painter.drawLine(start_x, start_y, end_x, end_y)
+        if self._tick_lines is None:
+            self._tick_lines = _tick_lines(rect)
+        painter.setPen(self._tick_pen)
+        painter.drawLines(self._tick_lines)
 
     def get_feedback_color(self, percentage):
         if percentage < 33:
-            return QColor("#10B981")
+            return _GOOD_COLOR
         elif percentage < 66:
-            return QColor("#F59E0B")
+            return _MODERATE_COLOR
         else:
-            return QColor("#EF4444")
+            return _BAD_COLOR
 
 class FeedbackMetricWidget(QFrame):
     def __init__(self, title, value, max_value):
@@ -307,10 +464,5 @@ class FeedbackMetricWidget(QFrame):
         
     def update_value(self, value):
         """Update the gauge value and trigger animation"""
-        # Update the gauge's target value
-        self.gauge.target_value = value
-        
-        # Reset and restart the animation
-        self.gauge.animation.setStartValue(self.gauge.value)
-        self.gauge.animation.setEndValue(value)
-        self.gauge.animation.start()
\ No newline at end of file
+        # Restart the animation from the gauge's current value
+        self.gauge.animate_to(value)
\ No newline at end of file
@@ -2,6 +2,29 @@ from PySide6.QtWidgets import (QWidget, QHBoxLayout, QPushButton, QLineEdit)
 from PySide6.QtGui import QIcon
 from PySide6.QtCore import Signal
 
+# Styles for the line edits and delete button, applied once on the LotInput itself
+_LOT_INPUT_QSS = """
+    QLineEdit {
+        border-radius: 5px;
+        background-color: #F0F0F0;
+        min-height: 30px;
+        padding: 5px;
+    }
+    QPushButton {
+        border: none;
+    }
+"""
+
+# Delete icons by file path, shared so every LotInput reuses one decoded icon
+_ICON_CACHE = {}
+
+def _cached_icon(icon):
+    if not isinstance(icon, str):
+        return QIcon(icon)
+    if icon not in _ICON_CACHE:
+        _ICON_CACHE[icon] = QIcon(icon)
+    return _ICON_CACHE[icon]
+
 class LotInput(QWidget):
     deleted = Signal(object)
     
@@ -12,6 +35,7 @@ class LotInput(QWidget):
         self.initUI()
         
     def initUI(self):
+        self.setStyleSheet(_LOT_INPUT_QSS)
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         
@@ -19,11 +43,9 @@ class LotInput(QWidget):
             lot_layout = QHBoxLayout()
             self.input = QLineEdit()
             self.input.setPlaceholderText('Lot (e.g., ZA301387803)')
-            self.input.setStyleSheet("border-radius: 5px; background-color: #F0F0F0; min-height: 30px; padding: 5px;")
             
             self.wafer_input = QLineEdit()
             self.wafer_input.setPlaceholderText('Wafer')
-            self.wafer_input.setStyleSheet("border-radius: 5px; background-color: #F0F0F0; min-height: 30px; padding: 5px;")
             
             lot_layout.addWidget(self.input)
             lot_layout.addWidget(self.wafer_input)
@@ -31,13 +53,11 @@ class LotInput(QWidget):
         else:
             self.input = QLineEdit()
             self.input.setPlaceholderText('Lot (e.g., ZA301387803)')
-            self.input.setStyleSheet("border-radius: 5px; background-color: #F0F0F0; min-height: 30px; padding: 5px;")
             layout.addWidget(self.input)
         
         self.deleteBtn = QPushButton()
-        self.deleteBtn.setIcon(QIcon(self.delete_icon))
+        self.deleteBtn.setIcon(_cached_icon(self.delete_icon))
         self.deleteBtn.setFixedSize(30, 30)
-        self.deleteBtn.setStyleSheet("QPushButton { border: none; }")
         self.deleteBtn.clicked.connect(lambda: self.deleted.emit(self))
         
         layout.addWidget(self.deleteBtn)
\ No newline at end of file
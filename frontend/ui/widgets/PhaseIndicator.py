@@ -10,10 +10,42 @@ class PhaseState(Enum):
     ACTIVE = 1
     COMPLETED = 2
 
+# Indicator and label stylesheets per state, built once instead of on every transition
+_PENDING_QSS = """
+    QLabel {
+        border: 2px solid #D1D5DB;
+        border-radius: 10px;
+        background-color: white;
+    }
+"""
+_ACTIVE_QSS = """
+    QLabel {
+        border: none;
+        border-radius: 10px;
+        background-color: #3B82F6;  /* blue-500 */
+    }
+"""
+_COMPLETED_QSS = """
+    QLabel {
+        border: none;
+        border-radius: 10px;
+        background-color: #22C55E;  /* green-500 */
+    }
+"""
+_LABEL_QSS_PENDING = "color: #6B7280;"  # gray-500
+_LABEL_QSS_ACTIVE = "color: #3B82F6;"  # blue-500
+_LABEL_QSS_COMPLETED = "color: #22C55E;"  # green-500
+
 class PhaseIndicator(QWidget):
+    _STYLES = {
+        PhaseState.PENDING: (_PENDING_QSS, _LABEL_QSS_PENDING),
+        PhaseState.ACTIVE: (_ACTIVE_QSS, _LABEL_QSS_ACTIVE),
+        PhaseState.COMPLETED: (_COMPLETED_QSS, _LABEL_QSS_COMPLETED),
+    }
+    
     def __init__(self, phase_text, parent=None):
         super().__init__(parent)
-        self.state = PhaseState.PENDING
+        self.state = None
         self.phase_text = phase_text
         
         # Create layout
@@ -36,33 +68,12 @@ class PhaseIndicator(QWidget):
         self.updateState(PhaseState.PENDING)
     
     def updateState(self, state):
+        # Restyling an unchanged state would only make Qt reparse the same stylesheets
+        if state == self.state:
+            return
         self.state = state
         
         # Update indicator style
-        if state == PhaseState.PENDING:
-            self.indicator.setStyleSheet("""
-                QLabel {
-                    border: 2px solid #D1D5DB;
-                    border-radius: 10px;
-                    background-color: white;
-                }
-            """)
-            self.label.setStyleSheet("color: #6B7280;")  # gray-500
-        elif state == PhaseState.ACTIVE:
-            self.indicator.setStyleSheet("""
-                QLabel {
-                    border: none;
-                    border-radius: 10px;
-                    background-color: #3B82F6;  /* blue-500 */
-                }
-            """)
-            self.label.setStyleSheet("color: #3B82F6;")  # blue-500
-        else:  # COMPLETED
-            self.indicator.setStyleSheet("""
-                QLabel {
-                    border: none;
-                    border-radius: 10px;
-                    background-color: #22C55E;  /* green-500 */
-                }
-            """)
-            self.label.setStyleSheet("color: #22C55E;")  # green-500
\ No newline at end of file
+        qss, label_qss = self._STYLES.get(state, self._STYLES[PhaseState.COMPLETED])
+        self.indicator.setStyleSheet(qss)
+        self.label.setStyleSheet(label_qss)
\ No newline at end of file
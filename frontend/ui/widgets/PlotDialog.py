@@ -1,19 +1,62 @@
-from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QPushButton
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QButtonGroup
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import seaborn as sns
 import numpy as np
 from scipy import stats
+from scipy.signal import fftconvolve
 import matplotlib.pyplot as plt
 import pandas as pd
 
+def _as_float32(values):
+    """Finite values as float32, unless the rounding would show against their spread"""
+    if values.size and np.abs(values).max() * np.finfo(np.float32).eps > np.ptp(values) * 1e-4:
+        return values
+    return values.astype(np.float32, copy=False)
+
+def _fast_kde(data, bw_adjust=1.5, cut=3, gridsize=512):
+    """Gaussian KDE of data on a regular grid, computed by binning and FFT convolution"""
+    n = len(data)
+    # Scott's rule scaled by bw_adjust, the bandwidth seaborn's kdeplot uses
+    bw = bw_adjust * np.std(data, ddof=1) * n ** (-1 / 5)
+    if not np.isfinite(bw) or bw <= 0:
+        return None, None
+    
+    counts, edges = np.histogram(data, bins=gridsize, range=(data.min() - cut * bw, data.max() + cut * bw))
+    dx = edges[1] - edges[0]
+    xs = (edges[:-1] + edges[1:]) / 2
+    
+    bw_bins = bw / dx
+    half_width = int(np.ceil(4 * bw_bins))
+    kernel = np.exp(-0.5 * (np.arange(-half_width, half_width + 1) / bw_bins) ** 2)
+    kernel /= kernel.sum()
+    density = fftconvolve(counts, kernel, mode='same') / (n * dx)
+    return xs, np.clip(density, 0, None)
+
 class PlotDialog(QDialog):
+    # Probability ticks of the cumulative frequency plot, on the normal quantile axis
+    _PROB_POINTS = [0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99, 0.999]
+    _TICK_YS = stats.norm.ppf(_PROB_POINTS)
+    _TICK_LABELS = [f'{p*100:.1f}%' for p in _PROB_POINTS]
+    _style_initialized = False
+    # Above this many points the whole histogram view (bars, bin count and KDE overlay)
+    # is drawn from a seeded subsample
+    _MAX_HISTOGRAM_POINTS = 20000
+    
     def __init__(self, input_data, reference_data, test_name, parent=None):
         super().__init__(parent)
         self.input_data = pd.to_numeric(np.array(input_data), errors='coerce')
         self.reference_data = pd.to_numeric(np.array(reference_data), errors='coerce')
+        # The data never changes, so NaN/Inf values are dropped once for every plot type
+        self._input_clean = _as_float32(self.input_data[np.isfinite(self.input_data)])
+        self._reference_clean = _as_float32(self.reference_data[np.isfinite(self.reference_data)])
+        self._plot_range = None
+        self._cdf_cache = {}
+        self._downsample_cache = {}
         self.test_name = test_name
-        self.current_plot = 'kde'
+        self.current_plot = None
         
         try:
             if parent and hasattr(parent, 'data'):
@@ -45,8 +88,11 @@ class PlotDialog(QDialog):
         return plot_min, plot_max
         
     def initUI(self):
-        plt.style.use('default')
-        sns.set_style("whitegrid")
+        # The style is global matplotlib state, so it is applied once per process
+        if not PlotDialog._style_initialized:
+            plt.style.use('default')
+            sns.set_style("whitegrid")
+            PlotDialog._style_initialized = True
         
         self.setWindowTitle(f"Distribution Plot - {self.test_name}")
         self.setMinimumSize(1000, 600)
@@ -55,10 +101,13 @@ class PlotDialog(QDialog):
         button_layout = QHBoxLayout()
         plot_types = ["KDE", "Histogram", "Box Plot", "Cumulative Frequency"]
         self.buttons = {}
+        # Exclusive checkable buttons mark the plot on screen
+        self.buttonGroup = QButtonGroup(self)
         
         for plot_type in plot_types:
             btn = QPushButton(plot_type)
             btn.setMinimumWidth(150)
+            btn.setCheckable(True)
             btn.setStyleSheet("""
                 QPushButton {
                     background-color: #f0f0f0;
@@ -69,18 +118,22 @@ class PlotDialog(QDialog):
                 QPushButton:hover {
                     background-color: #e0e0e0;
                 }
-                QPushButton:pressed {
+                QPushButton:pressed, QPushButton:checked {
                     background-color: #d0d0d0;
                 }
             """)
             plot_type_key = plot_type.lower().replace(" ", "_")
             btn.clicked.connect(lambda checked, pt=plot_type_key: self.update_plot(pt))
             button_layout.addWidget(btn)
+            self.buttonGroup.addButton(btn)
             self.buttons[plot_type_key] = btn
             
         layout.addLayout(button_layout)
         
         self.fig = Figure(figsize=(12, 7), dpi=100)
+        self.ax = self.fig.add_subplot(111)
+        # Fixed margins leave room for the title and tick labels of every plot type
+        self.fig.subplots_adjust(left=0.1, right=0.95, top=0.9, bottom=0.1)
         self.canvas = FigureCanvas(self.fig)
         layout.addWidget(self.canvas)
         
@@ -89,88 +142,81 @@ class PlotDialog(QDialog):
         self.update_plot("kde")
 
     def plot_limits(self, ax, plot_type="default"):
-        limit_lines = []
-        limit_labels = []
+        limits = [(self.lsl_input, 'blue', 'LSL Input'), (self.usl_input, 'blue', 'USL Input'),
+                  (self.lsl_ref, 'red', 'LSL Reference'), (self.usl_ref, 'red', 'USL Reference')]
+        limits = [(value, color, label) for value, color, label in limits
+                  if value is not None and not np.isnan(value)]
+        if not limits:
+            return [], []
         
-        if plot_type == "box_plot":
-            if self.lsl_input is not None and not np.isnan(self.lsl_input):
-                line = ax.axhline(y=self.lsl_input, color='blue', linestyle='--', alpha=0.7)
-                limit_lines.append(line)
-                limit_labels.append('LSL Input')
-                
-            if self.usl_input is not None and not np.isnan(self.usl_input):
-                line = ax.axhline(y=self.usl_input, color='blue', linestyle='--', alpha=0.7)
-                limit_lines.append(line)
-                limit_labels.append('USL Input')
-                
-            if self.lsl_ref is not None and not np.isnan(self.lsl_ref):
-                line = ax.axhline(y=self.lsl_ref, color='red', linestyle='--', alpha=0.7)
-                limit_lines.append(line)
-                limit_labels.append('LSL Reference')
-                
-            if self.usl_ref is not None and not np.isnan(self.usl_ref):
-                line = ax.axhline(y=self.usl_ref, color='red', linestyle='--', alpha=0.7)
-                limit_lines.append(line)
-                limit_labels.append('USL Reference')
-        else:            
-            if self.lsl_input is not None and not np.isnan(self.lsl_input):
-                line = ax.axvline(x=self.lsl_input, color='blue', linestyle='--', alpha=0.7)
-                limit_lines.append(line)
-                limit_labels.append('LSL Input')
-                
-            if self.usl_input is not None and not np.isnan(self.usl_input):
-                line = ax.axvline(x=self.usl_input, color='blue', linestyle='--', alpha=0.7)
-                limit_lines.append(line)
-                limit_labels.append('USL Input')
-                
-            if self.lsl_ref is not None and not np.isnan(self.lsl_ref):
-                line = ax.axvline(x=self.lsl_ref, color='red', linestyle='--', alpha=0.7)
-                limit_lines.append(line)
-                limit_labels.append('LSL Reference')
-                
-            if self.usl_ref is not None and not np.isnan(self.usl_ref):
-                line = ax.axvline(x=self.usl_ref, color='red', linestyle='--', alpha=0.7)
-                limit_lines.append(line)
-                limit_labels.append('USL Reference')
-            
+        values = [value for value, _, _ in limits]
+        colors = [color for _, color, _ in limits]
+        vertical = plot_type != "box_plot"
+        
+        # Draw every limit as one collection spanning the axes, like axvline/axhline
+        if vertical:
+            segments = [((value, 0), (value, 1)) for value in values]
+            transform = ax.get_xaxis_transform()
+        else:
+            segments = [((0, value), (1, value)) for value in values]
+            transform = ax.get_yaxis_transform()
+        ax.add_collection(LineCollection(segments, colors=colors, linestyles='--', alpha=0.7,
+                                         transform=transform), autolim=False)
+        
+        # Keep the limits in view along the data axis only
+        ax.update_datalim([(value, value) for value in values], updatex=vertical, updatey=not vertical)
+        ax.autoscale_view(scalex=vertical, scaley=not vertical)
+        
+        # Proxy lines carry the legend entries for the collection
+        limit_lines = [Line2D([], [], color=color, linestyle='--', alpha=0.7) for color in colors]
+        limit_labels = [label for _, _, label in limits]
         return limit_lines, limit_labels
 
     def update_plot(self, plot_type):
+        # Clicking the plot already on screen would only rebuild the same figure
+        if plot_type == self.current_plot:
+            return
+        
         try:
-            self.fig.clear()
-            plt.style.use('default')
-            sns.set_style("whitegrid")
-            
-            ax = self.fig.add_subplot(111)
-            self.fig.subplots_adjust(left=0.1, right=0.95, top=0.9, bottom=0.1)
+            # Reuse the one Axes instead of tearing the figure down on every switch
+            ax = self.ax
+            ax.cla()
             
-            input_data = self.input_data[~np.isnan(self.input_data) & ~np.isinf(self.input_data)]
-            reference_data = self.reference_data[~np.isnan(self.reference_data) & ~np.isinf(self.reference_data)]
+            input_data = self._input_clean
+            reference_data = self._reference_clean
             
             if plot_type == "kde":
                 if len(input_data) < 2 or len(reference_data) < 2:
                     ax.text(0.5, 0.5, 'Not enough valid data points for KDE plot',
                            ha='center', va='center', transform=ax.transAxes)
                 else:
-                    limits = [self.lsl_input, self.usl_input, self.lsl_ref, self.usl_ref]
-                    plot_min, plot_max = self.get_plot_range(input_data, reference_data, limits)
+                    if self._plot_range is None:
+                        limits = [self.lsl_input, self.usl_input, self.lsl_ref, self.usl_ref]
+                        self._plot_range = self.get_plot_range(input_data, reference_data, limits)
+                    plot_min, plot_max = self._plot_range
                     
-                    sns.kdeplot(data=input_data, ax=ax, label='Input Data',
-                              color='#1f77b4', fill=True, alpha=0.3,
-                              common_norm=False, bw_adjust=1.5,
-                              cut=3)
-                    
-                    sns.kdeplot(data=reference_data, ax=ax, label='Reference Data',
-                              color='#ff7f0e', fill=True, alpha=0.3,
-                              common_norm=False, bw_adjust=1.5,
-                              cut=3)
+                    for data, color, label in ((input_data, '#1f77b4', 'Input Data'),
+                                               (reference_data, '#ff7f0e', 'Reference Data')):
+                        xs, density = _fast_kde(data)
+                        if xs is None:
+                            continue
+                        ax.fill_between(xs, density, color=color, alpha=0.3, label=label)
+                        ax.plot(xs, density, color=color)
                     
                     ax.set_xlim(plot_min, plot_max)
                 
                 ax.set_ylabel("Density")
                 
             elif plot_type == "histogram":
+                input_data = self.histogram_sample(input_data, 'input')
+                reference_data = self.histogram_sample(reference_data, 'reference')
                 bins = min(int(np.sqrt(len(input_data))), 50)
+                # Shared edges over both series keep the bars comparable and skip seaborn's edge search
+                if len(input_data) and len(reference_data):
+                    low = min(input_data.min(), reference_data.min())
+                    high = max(input_data.max(), reference_data.max())
+                    if high > low:
+                        bins = np.linspace(low, high, bins + 1)
                 
                 sns.histplot(data=input_data, ax=ax, label='Input Data', 
                         color='#1f77b4', alpha=0.5, stat='density', 
@@ -193,9 +239,8 @@ class PlotDialog(QDialog):
                 self.create_cumulative_frequency_plot(ax, input_data, '#1f77b4', 'Input Data')
                 self.create_cumulative_frequency_plot(ax, reference_data, '#ff7f0e', 'Reference Data')
                 
-                prob_points = [0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99, 0.999]
-                ax.set_yticks(stats.norm.ppf(prob_points))
-                ax.set_yticklabels([f'{p*100:.1f}%' for p in prob_points])
+                ax.set_yticks(self._TICK_YS)
+                ax.set_yticklabels(self._TICK_LABELS)
                 ax.set_ylabel("Cumulative Probability")
 
             limit_lines, limit_labels = self.plot_limits(ax, plot_type)
@@ -205,47 +250,56 @@ class PlotDialog(QDialog):
             labels.extend(limit_labels)
             
             if plot_type != "box_plot":
-                for loc in ['best', 'upper right', 'upper left', 'lower right', 'lower left']:
-                    try:
-                        legend = ax.legend(handles, labels, loc=loc, frameon=True, 
-                                        fancybox=True, framealpha=0.9)
-                        if legend:
-                            break
-                    except:
-                        continue
+                ax.legend(handles, labels, loc='best', frameon=True, fancybox=True, framealpha=0.9)
             
             ax.set_title(f"{plot_type.replace('_', ' ').title()} - {self.test_name}", pad=20)
             ax.set_xlabel("Value")
             ax.grid(True, linestyle='--', alpha=0.7)
             
-            self.fig.tight_layout()
             self.canvas.draw()
+            self.current_plot = plot_type
+            self.buttons[plot_type].setChecked(True)
             
         except Exception as e:
             print(f"Error updating plot: {str(e)}")
             import traceback
             traceback.print_exc()
 
-    def create_cumulative_frequency_plot(self, ax, data, color, label):
-        try:
+    def histogram_sample(self, data, key):
+        """Data capped at _MAX_HISTOGRAM_POINTS by a seeded subsample, drawn once per series"""
+        if len(data) <= self._MAX_HISTOGRAM_POINTS:
+            return data
+        if key not in self._downsample_cache:
+            rng = np.random.default_rng(0)
+            self._downsample_cache[key] = rng.choice(data, self._MAX_HISTOGRAM_POINTS, replace=False)
+        return self._downsample_cache[key]
+
+    def cumulative_frequency_points(self, data, label):
+        """Sorted data, its normal quantiles and their quartiles, computed once per series"""
+        if label not in self._cdf_cache:
             data_array = np.array(data)
-            valid_data = data_array[~np.isnan(data_array)]
-            
-            if len(valid_data) == 0:
-                print(f"No valid data for {label}")
-                return ax
-                
-            sorted_data = np.sort(valid_data)
+            sorted_data = np.sort(data_array[~np.isnan(data_array)])
             n_valid = len(sorted_data)
             
             emp_prob = (np.arange(1, n_valid + 1) - 0.5) / n_valid
             y = stats.norm.ppf(emp_prob)
+            quartiles = (np.percentile(sorted_data, [25, 75]), np.percentile(y, [25, 75])) if n_valid else None
+            self._cdf_cache[label] = (sorted_data, y, quartiles)
+        return self._cdf_cache[label]
+
+    def create_cumulative_frequency_plot(self, ax, data, color, label):
+        try:
+            sorted_data, y, quartiles = self.cumulative_frequency_points(data, label)
+            
+            if len(sorted_data) == 0:
+                print(f"No valid data for {label}")
+                return ax
             
-            q1x, q3x = np.percentile(sorted_data, [25, 75])
-            q1y, q3y = np.percentile(y, [25, 75])
+            (q1x, q3x), (q1y, q3y) = quartiles
 
             ax.plot([q1x, q3x], [q1y, q3y], color='gray', linewidth=2)
-            ax.plot(sorted_data, y, 'o', color=color, label=label, markersize=4, alpha=0.6)
+            # One PathCollection with per-point offsets; s=16 matches the old markersize=4
+            ax.scatter(sorted_data, y, s=16, color=color, label=label, alpha=0.6, edgecolors='none')
             
         except Exception as e:
             print(f"Error creating cumulative frequency plot: {str(e)}")